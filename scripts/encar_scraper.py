@@ -18,7 +18,9 @@ and **forces the list to lazy-load all rows** so it won’t stop after ~5.
 
 from splinter import Browser
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
 import time, os, json, csv, re
+import threading, queue
 from collections import deque
 from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 from selenium.common.exceptions import (
@@ -241,31 +243,73 @@ def normalize_ad_price_to_krw(ad_price) -> int:
 # ======== /PRICE NORMALIZATION ========
 
 # ---------------- State/DOM helpers ----------------
-def wait_ready(browser, timeout=10):
+# Async-script waiter: resolves on the DOM/readiness signal itself (MutationObserver,
+# readystatechange, load, hashchange) instead of sleeping between polls.
+# __PRED__ is spliced in as a JS expression; bursts of mutations are coalesced.
+WAIT_UNTIL_JS = r"""
+var done = arguments[arguments.length - 1];
+var timeoutMs = arguments[0];
+function check(){ try { return !!(__PRED__); } catch(e){ return false; } }
+if (check()) { done(true); return; }
+var finished = false, pending = false, mo = null, timer = null;
+function finish(v){
+  if (finished) return;
+  finished = true;
+  try { if (mo) mo.disconnect(); } catch(e){}
+  clearTimeout(timer);
+  document.removeEventListener('readystatechange', onSignal, true);
+  window.removeEventListener('load', onSignal, true);
+  window.removeEventListener('hashchange', onSignal, true);
+  done(v);
+}
+function onSignal(){
+  if (finished || pending) return;
+  pending = true;
+  setTimeout(function(){ pending = false; if (check()) finish(true); }, 25);
+}
+try {
+  mo = new MutationObserver(onSignal);
+  mo.observe(document.documentElement || document, {childList:true, subtree:true, characterData:true});
+} catch(e){}
+document.addEventListener('readystatechange', onSignal, true);
+window.addEventListener('load', onSignal, true);
+window.addEventListener('hashchange', onSignal, true);
+timer = setTimeout(function(){ finish(check()); }, timeoutMs);
+"""
+
+def wait_until(browser, predicate_js, timeout=10):
+    """
+    Block until the JS expression `predicate_js` is truthy in the page, or timeout.
+    If the document unloads mid-wait (navigation) the script is re-armed on the new page.
+    """
+    script = WAIT_UNTIL_JS.replace("__PRED__", predicate_js)
     t0 = time.time()
-    while time.time()-t0 < timeout:
+    while True:
+        left = timeout - (time.time() - t0)
+        if left <= 0:
+            return False
         try:
-            if browser.evaluate_script("document.readyState")=="complete":
-                return True
-        except:
-            pass
-        time.sleep(0.2)
-    return False
+            return bool(browser.driver.execute_async_script(script, int(left * 1000)))
+        except Exception:
+            try:
+                if browser.evaluate_script("!!(" + predicate_js + ")"):
+                    return True
+            except Exception:
+                pass
+            time.sleep(min(0.1, max(0.0, left)))
+
+READY_JS = "document.readyState === 'complete'"
+
+STATE_PRESENT_JS = (
+    "typeof window.__PRELOADED_STATE__ !== 'undefined' || "
+    "Array.from(document.scripts||[]).some(function(s){ return (s.text||'').indexOf('__PRELOADED_STATE__')>=0; })"
+)
+
+def wait_ready(browser, timeout=10):
+    return wait_until(browser, READY_JS, timeout)
 
 def wait_for_state(browser, timeout=12):
-    t0 = time.time()
-    js = r"""(function(){
-      if (typeof window.__PRELOADED_STATE__ !== 'undefined') return true;
-      return Array.from(document.scripts||[]).some(s => (s.text||'').indexOf('__PRELOADED_STATE__')>=0);
-    })()"""
-    while time.time()-t0 < timeout:
-        try:
-            if browser.evaluate_script(js):
-                return True
-        except:
-            pass
-        time.sleep(0.25)
-    return False
+    return wait_until(browser, STATE_PRESENT_JS, timeout)
 
 def get_full_state(browser):
     try:
@@ -357,17 +401,10 @@ def body_type_from_title(title: str) -> str:
     return guess_bodytype_from_text(title or "")
 
 # ---------------- Ensure translation ----------------
+NOT_KOREAN_JS = r"!/[\uac00-\ud7a3]/.test(document.body ? document.body.innerText.slice(0,5000) : '')"
+
 def ensure_english(browser, timeout=6):
-    t0 = time.time()
-    while time.time()-t0 < timeout:
-        try:
-            body = browser.evaluate_script("document.body?document.body.innerText.slice(0,5000):''") or ""
-            if not is_korean(body):
-                return True
-        except:
-            pass
-        time.sleep(0.4)
-    return False
+    return wait_until(browser, NOT_KOREAN_JS, timeout)
 
 # ---------------- ALERT-SAFE URL HELPERS ----------------
 def _handle_alert_if_any(browser):
@@ -846,7 +883,6 @@ def parse_inline_detail_values(panel):
 
 def get_inline_report_url(browser, row_index):
     _ = _get_inline_panel_html(browser, row_index)
-    time.sleep(0.25)
 
     try:
         browser.evaluate_script(r"""
@@ -1150,7 +1186,9 @@ def get_list_records_from_state(state):
                         pnum = _coerce_float(pnum)
                         ptxt = it.get("priceText") or it.get("price") or it.get("salePrice") or it.get("listPrice") or ""
                         href = it.get("link") or it.get("href") or ""
-                        results.append({"idx": i, "title": str(title), "priceText": str(ptxt), "priceNum": pnum, "href": href})
+                        carid = str(it.get("carId") or it.get("carID") or it.get("carNo") or it.get("carno") or "").strip()
+                        if not re.fullmatch(r'\d{6,}', carid): carid = ""
+                        results.append({"idx": i, "title": str(title), "priceText": str(ptxt), "priceNum": pnum, "href": href, "carid": carid})
     return results
 
 def list_row_dom_extract(row):
@@ -1500,12 +1538,16 @@ def click_detail_and_get_url(browser, row, retries=3):
     except: return ""
 
 def switch_to_new_tab(browser, prev_count, timeout=8):
-    t0=time.time()
-    while time.time()-t0<timeout:
-        if len(browser.windows)>prev_count:
-            browser.windows[-1].is_current=True; return True
-        time.sleep(0.2)
-    return False
+    # Window handles are not observable from page JS; WebDriverWait with a tight
+    # poll returns on the first check after the handle appears.
+    try:
+        WebDriverWait(browser.driver, timeout, poll_frequency=0.05).until(
+            lambda d: len(d.window_handles) > prev_count
+        )
+    except Exception:
+        return False
+    browser.windows[-1].is_current = True
+    return True
 
 def _join_blob(parts):
     return " ".join(str(p) for p in parts if p).strip().lower()
@@ -1533,17 +1575,27 @@ def _normalize_color(text, features_blob=""):
     return "Other"
 
 # ---------------- Paging ----------------
+# Cheap fingerprint of the rendered list: first/last row text + count.
+LIST_SIGNATURE_JS = ("(function(){ var r=document.querySelectorAll('tr[data-index]');"
+                     " return r.length ? r.length + '|' + (r[0].innerText||'').slice(0,80) + '|' +"
+                     " (r[r.length-1].innerText||'').slice(0,80) : ''; })()")
+
 def go_to_page(browser, page_no, timeout=10):
+    try:
+        prev_sig = browser.evaluate_script(LIST_SIGNATURE_JS) or ""
+    except Exception:
+        prev_sig = ""
+
     def wait_rows():
-        t0 = time.time()
-        while time.time()-t0 < timeout:
-            try:
-                if browser.is_element_present_by_css('tr[data-index="0"]', wait_time=0.5):
-                    return True
-            except:
-                pass
-            time.sleep(0.2)
-        return False
+        # Resolve once the re-rendered rows differ from the page we left;
+        # if nothing changes, fall back to "first row is present" at timeout.
+        pred = "(function(s){ return s !== '' && s !== %s; })(%s)" % (json.dumps(prev_sig), LIST_SIGNATURE_JS)
+        if wait_until(browser, pred, timeout):
+            return True
+        try:
+            return bool(browser.find_by_css('tr[data-index="0"]'))
+        except Exception:
+            return False
 
     try:
         js = f"""
@@ -1626,10 +1678,156 @@ def build_browser():
     })
     return Browser("chrome", options=opts, headless=False)
 
-def main():
+# ---------------- Parallel detail workers (--workers N) ----------------
+CSV_FIELDS = [
+    "prodhuesi","modeli","varianti","viti",
+    "cmimi_eur","kilometrazhi_km","karburanti","ngjyra",
+    "transmisioni","uleset","vin","engine_cc","images","listing_url",
+    "opsionet","raporti_url"
+]
+
+def csv_row_from_albanian(alb):
+    row_out = {
+        "prodhuesi": alb["prodhuesi"],
+        "modeli": alb["modeli"],
+        "varianti": alb["varianti"],
+        "viti": alb["viti"],
+        "cmimi_eur": alb["cmimi_eur"],
+        "kilometrazhi_km": alb["kilometrazhi_km"],
+        "karburanti": alb["karburanti"],
+        "ngjyra": alb["ngjyra"],
+        "transmisioni": alb["transmisioni"],
+        "uleset": "" if alb["uleset"] is None else str(alb["uleset"]),
+        "vin": alb["vin"],
+        "engine_cc": alb["engine_cc"],
+        "images": ";".join(alb.get("images", [])),
+        "listing_url": alb["listing_url"],
+        "opsionet": alb["opsionet"],
+        "raporti_url": alb["raporti_url"],
+    }
+    return fill_blanks_in_row(row_out)
+
+def page_detail_jobs(browser):
+    """
+    Detail jobs for the list page on screen, keyed by the carids found in
+    __PRELOADED_STATE__ (falls back to the rows' detail anchors).
+    """
+    list_state = get_full_state(browser) if wait_for_state(browser, 3) else {}
+    jobs = []; seen = set()
+    for rec in get_list_records_from_state(list_state):
+        cid = rec.get("carid") or ""
+        href = absolutize(rec.get("href") or "")
+        if not cid:
+            m = re.search(r'carid=(\d{6,})', href)
+            cid = m.group(1) if m else ""
+        if not cid or cid in seen: continue
+        seen.add(cid)
+        title = (rec.get("title") or "").strip()
+        brand, model, variant = parse_title_brand_model_variant(title)
+        _krw, eur_list = parse_list_price_eur((rec.get("priceText") or "").strip(), rec.get("priceNum", None), "")
+        jobs.append({
+            "carid": cid,
+            "detail_url": href or f"https://www.encar.com/dc/dc_cardetailview.do?carid={cid}",
+            "list_hint": {
+                "prodhuesi": brand, "modeli": model, "varianti": variant,
+                "cmimi_eur": eur_list, "engine_cc_hint": 0,
+                "color_hint": "", "seats_hint": 0, "inline_report_url": "",
+                "title": title,
+            },
+        })
+    if not jobs:
+        try:
+            hrefs = browser.evaluate_script(
+                "JSON.stringify(Array.from(document.querySelectorAll('tr[data-index] a[href*=\"carid=\"]')).map(a=>a.href))"
+            ) or "[]"
+            hrefs = json.loads(hrefs)
+        except:
+            hrefs = []
+        for href in hrefs:
+            m = re.search(r'carid=(\d{6,})', href or "")
+            if not m or m.group(1) in seen: continue
+            seen.add(m.group(1))
+            jobs.append({"carid": m.group(1), "detail_url": href, "list_hint": {}})
+    return jobs
+
+def detail_worker(wid, jobs, emit):
+    """One worker = one independent Chrome; runs until it sees the None sentinel."""
+    browser = None
+    try:
+        while True:
+            job = jobs.get()
+            if job is None:
+                jobs.task_done()
+                return
+            try:
+                if browser is None:
+                    browser = build_browser()
+                browser.visit(job["detail_url"])
+                raw = scrape_detail_raw(browser)
+                alb = to_albanian_schema(raw, job["detail_url"], job["list_hint"])
+                emit(csv_row_from_albanian(alb), job)
+            except Exception as e:
+                print(f"[worker {wid}] {job.get('detail_url')}: {e}")
+            finally:
+                jobs.task_done()
+    finally:
+        if browser is not None:
+            try: browser.quit()
+            except: pass
+
+def run_worker_pool(browser, writer, workers):
+    """
+    The list browser pages through results and fills a shared queue that
+    `workers` detail browsers drain in parallel. Returns rows written.
+    """
+    jobs = queue.Queue(maxsize=workers * 4)
+    lock = threading.Lock()
+    done = [0]
+
+    def emit(row_out, job):
+        with lock:
+            writer.writerow(row_out)
+            done[0] += 1
+            print(f"✅ {done[0]}/{MAX_LISTINGS} (carid {job['carid']})")
+
+    threads = [threading.Thread(target=detail_worker, args=(i, jobs, emit), name=f"detail-{i}", daemon=True)
+               for i in range(workers)]
+    for t in threads: t.start()
+
+    queued = set()
+    current_page = 1
+    _, total_pages = get_paging_info(browser)
+    try:
+        while len(queued) < MAX_LISTINGS:
+            if current_page > 1:
+                if total_pages and current_page > total_pages:
+                    break
+                if not go_to_page(browser, current_page):
+                    break
+            fresh = [j for j in page_detail_jobs(browser) if j["carid"] not in queued]
+            if not fresh:
+                break
+            for job in fresh[:MAX_LISTINGS - len(queued)]:
+                queued.add(job["carid"])
+                jobs.put(job)
+            print(f"[pool] page {current_page}: queued {len(queued)} detail jobs")
+            current_page += 1
+    finally:
+        for _ in threads: jobs.put(None)
+        for t in threads: t.join()
+    return done[0]
+
+def parse_args(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Encar list/detail scraper")
+    ap.add_argument("--workers", type=int, default=1,
+                    help="parallel detail workers, each with its own browser (default: 1 = sequential)")
+    return ap.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
     with build_browser() as browser:
         browser.visit(BASE_URL)
-        time.sleep(3)
         wait_ready(browser, 10)
         ensure_english(browser, 5)
 
@@ -1640,17 +1838,15 @@ def main():
         os.makedirs(CSV_DIR, exist_ok=True)
         csv_path = os.path.join(CSV_DIR, CSV_NAME)
 
-        fields = [
-            "prodhuesi","modeli","varianti","viti",
-            "cmimi_eur","kilometrazhi_km","karburanti","ngjyra",
-            "transmisioni","uleset","vin","engine_cc","images","listing_url",
-            "opsionet","raporti_url"
-        ]
-
         with open(csv_path, "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
             writer.writeheader()
 
+            if args.workers > 1:
+                total_done = run_worker_pool(browser, writer, args.workers)
+                print(f"🎯 Finished ({total_done} rows, {args.workers} workers). Saved to {csv_path}")
+                return
+
             total_done = 0
             current_page = 1
             _, total_pages = get_paging_info(browser)
@@ -1666,7 +1862,6 @@ def main():
                     cnt = force_load_list_rows(browser, want=PER_PAGE)
                     print(f"[list] page {current_page} rows loaded: {cnt}")
 
-                time.sleep(0.8)
                 ensure_english(browser, 3)
 
                 list_state = get_full_state(browser) if wait_for_state(browser, 3) else {}
@@ -1722,8 +1917,6 @@ def main():
                     detail_url = click_detail_and_get_url(browser, row)
 
                     if detail_url and switch_to_new_tab(browser, prev_tabs, 8):
-                        time.sleep(0.9)
-                        ensure_english(browser, 4)
                         raw = scrape_detail_raw(browser)
                         try:
                             browser.windows.current.close()
@@ -1731,7 +1924,6 @@ def main():
                         try:
                             browser.windows[0].is_current = True
                         except: pass
-                        time.sleep(0.2)
                     else:
                         raw = {
                             "manufacturer": "", "model": "", "grade": "",
@@ -1763,25 +1955,7 @@ def main():
 
                     alb = to_albanian_schema(raw, detail_url, list_hint)
 
-                    row_out = {
-                        "prodhuesi": alb["prodhuesi"],
-                        "modeli": alb["modeli"],
-                        "varianti": alb["varianti"],
-                        "viti": alb["viti"],
-                        "cmimi_eur": alb["cmimi_eur"],
-                        "kilometrazhi_km": alb["kilometrazhi_km"],
-                        "karburanti": alb["karburanti"],
-                        "ngjyra": alb["ngjyra"],
-                        "transmisioni": alb["transmisioni"],
-                        "uleset": "" if alb["uleset"] is None else str(alb["uleset"]),
-                        "vin": alb["vin"],
-                        "engine_cc": alb["engine_cc"],
-                        "images": ";".join(alb.get("images", [])),
-                        "listing_url": alb["listing_url"],
-                        "opsionet": alb["opsionet"],
-                        "raporti_url": alb["raporti_url"],
-                    }
-                    row_out = fill_blanks_in_row(row_out)
+                    row_out = csv_row_from_albanian(alb)
                     writer.writerow(row_out)
 
                     total_done += 1
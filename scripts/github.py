@@ -29,9 +29,10 @@ Headless-hardening + observability:
 
 from splinter import Browser
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
 import time, os, json, csv, re
 from collections import deque, defaultdict
-from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, quote, unquote
 from selenium.common.exceptions import (
     ElementNotInteractableException,
     ElementClickInterceptedException,
@@ -45,8 +46,18 @@ import pathlib
 import tempfile, shutil
 from contextlib import contextmanager
 import random
-
-def db_conn():
+import threading
+import sqlite3
+import hashlib
+from typing import Any, Optional
+
+# Optional fast/typed JSON decoding; plain json + dict walking without it
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+def db_conn(autocommit=True):
     return pymysql.connect(
         host=os.getenv("DB_HOST", "127.0.0.1"),
         port=int(os.getenv("DB_PORT", "3306")),
@@ -55,13 +66,117 @@ def db_conn():
         database=os.getenv("DB_DATABASE"),
         charset="utf8mb4",
         cursorclass=pymysql.cursors.DictCursor,
-        autocommit=True,
+        autocommit=autocommit,
     )
 
-def upsert_vehicle(row):
-    with db_conn() as conn:
-        with conn.cursor() as cur:
-            cur.execute(UPSERT_SQL, row)
+class VehicleWriter:
+    """
+    One long-lived MySQL connection (one handshake over the SSH tunnel per run)
+    that buffers rows and upserts them with executemany once `batch_size` rows
+    or `flush_secs` seconds have accumulated. Each flush commits explicitly; on a
+    dropped connection it reconnects and replays the batch (UPSERT_SQL is idempotent).
+    """
+    RETRYABLE = (pymysql.err.OperationalError, pymysql.err.InterfaceError)
+
+    def __init__(self, batch_size=None, flush_secs=None, retries=2):
+        self.batch_size = int(batch_size or DB_BATCH_SIZE)
+        self.flush_secs = float(flush_secs if flush_secs is not None else DB_FLUSH_SECS)
+        self.retries = retries
+        self.conn = None
+        self.buf = []
+        self.last_flush = time.time()
+        self.lock = threading.RLock()
+        self.rows = 0
+        self.flushes = 0
+        self.secs = 0.0
+
+    def _connect(self):
+        if self.conn is None:
+            self.conn = db_conn(autocommit=False)
+        return self.conn
+
+    def _reset(self):
+        try:
+            if self.conn is not None:
+                self.conn.close()
+        except Exception:
+            pass
+        self.conn = None
+
+    def add(self, row):
+        with self.lock:
+            self.buf.append(dict(row))
+            if len(self.buf) >= self.batch_size or time.time() - self.last_flush >= self.flush_secs:
+                self.flush()
+
+    def flush(self):
+        with self.lock:
+            if not self.buf:
+                self.last_flush = time.time()
+                return 0
+            batch, self.buf = self.buf, []
+            t0 = time.time()
+            for attempt in range(self.retries + 1):
+                try:
+                    conn = self._connect()
+                    with conn.cursor() as cur:
+                        cur.executemany(UPSERT_SQL, batch)
+                    conn.commit()
+                    break
+                except self.RETRYABLE as e:
+                    self._reset()
+                    if attempt >= self.retries:
+                        print(f"[db] batch of {len(batch)} rows failed after {attempt + 1} tries ({e}); replaying row by row")
+                        return self._replay(batch, t0)
+                    print(f"[db] connection lost ({e}); reconnecting, retry {attempt + 1}/{self.retries}")
+                    time.sleep(0.5 * (attempt + 1))
+                except Exception as e:
+                    try: self.conn.rollback()
+                    except Exception: pass
+                    print(f"[db] batch of {len(batch)} rows failed ({e}); replaying row by row")
+                    return self._replay(batch, t0)
+            return self._done(len(batch), t0)
+
+    def _replay(self, batch, t0):
+        """Upsert `batch` one row per commit so a bad row costs only itself."""
+        ok = 0
+        for row in batch:
+            try:
+                conn = self._connect()
+                with conn.cursor() as cur:
+                    cur.execute(UPSERT_SQL, row)
+                conn.commit()
+                ok += 1
+            except Exception as e:
+                if isinstance(e, self.RETRYABLE):
+                    self._reset()
+                else:
+                    try: self.conn.rollback()
+                    except Exception: pass
+                print(f"[db] row {row.get('listing_url')} failed: {e}")
+        return self._done(ok, t0) if ok else 0
+
+    def _done(self, n, t0):
+        with self.lock:
+            dt = time.time() - t0
+            self.rows += n
+            self.flushes += 1
+            self.secs += dt
+            self.last_flush = time.time()
+            print(f"[db] flushed {n} rows in {dt:.2f}s ({n / max(dt, 1e-6):.0f} rows/s)")
+            return n
+
+    def stats(self):
+        return {"rows": self.rows, "flushes": self.flushes, "secs": round(self.secs, 3),
+                "rows_per_sec": round(self.rows / self.secs, 1) if self.secs else 0.0}
+
+    def close(self):
+        with self.lock:
+            self.flush()
+            self._reset()
+        if self.flushes:
+            st = self.stats()
+            print(f"[db] total {st['rows']} rows in {st['flushes']} flushes, {st['rows_per_sec']} rows/s")
 
 # ---------------- CONFIG ----------------
 BASE_URL = "https://www.encar.com/fc/fc_carsearchlist.do?carType=for#!%7B%22action%22%3A%22(And.Hidden.N._.CarType.N._.SellType.%EC%9D%BC%EB%B0%98._.Year.range(201500..).)%22%2C%22toggle%22%3A%7B%7D%2C%22layer%22%3A%22%22%2C%22sort%22%3A%22ModifiedDate%22%2C%22page%22%3A1%2C%22limit%22%3A20%2C%22searchKey%22%3A%22%22%2C%22loginCheck%22%3Afalse%7D"
@@ -73,13 +188,99 @@ SEARCH_URLS = [
     "https://www.encar.com/fc/fc_carsearchlist.do?carType=for",
 ]
 
+# Year bands for search-filter shards ("2015-2016,2017-2018,2019-", "auto" = one per
+# year from 2015). Empty = one query over the whole BASE_URL result set.
+YEAR_BANDS = os.getenv("YEAR_BANDS", "").strip()
+
 MAX_LISTINGS = int(os.getenv("MAX_LISTINGS", "3"))
 PER_PAGE     = int(os.getenv("PER_PAGE", "20"))
+# Larger `limit` values probed on page 1; the biggest the site fully renders wins
+# (PAGE_SIZES= disables the probe and keeps PER_PAGE).
+PAGE_SIZES   = [int(x) for x in os.getenv("PAGE_SIZES", "100,50").split(",") if x.strip().isdigit()]
 APP_ROOT = pathlib.Path(__file__).resolve().parent
 CSV_DIR  = os.getenv("CSV_DIR", str(APP_ROOT / "out"))
 os.makedirs(CSV_DIR, exist_ok=True)
 CSV_NAME = "cars.csv"
 WRITE_DB = os.getenv("WRITE_DB", "false").lower() in ("1", "true", "yes")
+# VehicleWriter flush thresholds: whichever of rows / seconds is hit first
+DB_BATCH_SIZE = int(os.getenv("DB_BATCH_SIZE", "100"))
+DB_FLUSH_SECS = float(os.getenv("DB_FLUSH_SECS", "10"))
+
+# Seen-listing store: carid -> fingerprint(title, list price, href). Rows whose
+# fingerprint is unchanged since the last run skip the detail scrape. SEEN_DB="" disables;
+# SEEN_MAX_AGE_H>0 forces a re-scrape once the last full scrape is older than that.
+SEEN_DB = os.getenv("SEEN_DB", os.path.join(CSV_DIR, "seen.sqlite3")).strip()
+SEEN_MAX_AGE_H = float(os.getenv("SEEN_MAX_AGE_H", "0") or 0)
+# The list is sorted by ModifiedDate: stop paging once a whole page is at or below
+# the (modified, carid) high-water mark a previous complete run stored in SEEN_DB.
+WATERMARK = os.getenv("WATERMARK", "1").strip().lower() in ("1", "true", "yes")
+# Progress journal rewritten after every CSV row; `--resume` restarts from it.
+CHECKPOINT_PATH = os.getenv("CHECKPOINT_PATH", os.path.join(CSV_DIR, CSV_NAME + ".ckpt.json"))
+# Rows waiting for the writer thread before the scraping loop blocks
+ROW_QUEUE_SIZE = int(os.getenv("ROW_QUEUE_SIZE", "256"))
+# Long-lived detail tabs re-navigated car after car (0 = click + new tab + close per car)
+DETAIL_TABS = int(os.getenv("DETAIL_TABS", "1"))
+# Start fetching row i+1's detail (HTTP worker / pooled tab) while row i is written
+PREFETCH = os.getenv("PREFETCH", "1").strip().lower() in ("1", "true", "yes")
+
+# Detail fetch mode: "http" = plain pooled HTTP + hydration state parse, Selenium only
+# when the HTML lacks the state; "browser" = always drive Chrome (old behaviour).
+DETAIL_FETCH = os.getenv("DETAIL_FETCH", "http").strip().lower()
+DETAIL_URL_BASE = "https://fem.encar.com/cars/detail/"
+# Override to point the fast path at a local stand-in serving saved pages; only the
+# HTTP fetch uses it, listing_url / fingerprints keep the canonical DETAIL_URL_BASE.
+DETAIL_FETCH_BASE = os.getenv("DETAIL_FETCH_BASE", DETAIL_URL_BASE)
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "8"))
+
+# Stable desktop UA (override with UA=...), shared by Chrome and the HTTP client
+USER_AGENT = os.getenv(
+    "UA",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+
+# Resource blocking via CDP Network.setBlockedURLs. Image URLs are harvested from
+# state / data-* attributes, so pixels, fonts, media and trackers are never needed.
+#   BLOCK_RESOURCES=0           -> load everything (old behaviour)
+#   BLOCK_URLS="*.png*,*ads*"   -> replace the default pattern list ('*' wildcards)
+#   BLOCK_URLS_EXTRA="*foo.com*" -> append to it
+BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES", "1").strip().lower() in ("1", "true", "yes")
+DEFAULT_BLOCK_URLS = [
+    # images
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*",
+    # fonts
+    "*.woff*", "*.ttf*", "*.otf*", "*.eot*",
+    # media
+    "*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*",
+    # ads / analytics
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*googleadservices.com*", "*facebook.net*",
+    "*connect.facebook.*", "*criteo.*", "*wcs.naver.net*", "*analytics.tiktok.com*",
+    "*hotjar.com*", "*clarity.ms*", "*adservice*",
+]
+BLOCK_URLS = [p.strip() for p in (os.getenv("BLOCK_URLS") or ",".join(DEFAULT_BLOCK_URLS)).split(",") if p.strip()]
+BLOCK_URLS += [p.strip() for p in os.getenv("BLOCK_URLS_EXTRA", "").split(",") if p.strip()]
+# TRANSLATE=0: skip Chrome auto-translate and read the Korean page as-is; the KR
+# dictionaries below map Encar's own values straight to the Albanian schema.
+TRANSLATE = os.getenv("TRANSLATE", "1").strip().lower() in ("1", "true", "yes")
+# Hydration payloads looked for, in order, on the live page and in raw HTML:
+# window globals, `X = {...}` script assignments, <script id="X" type="application/json">,
+# then the largest inline application/json script. Add more with HYDRATION_GLOBALS_EXTRA.
+HYDRATION_GLOBALS = ["__PRELOADED_STATE__", "__NEXT_DATA__", "__NUXT__", "__APOLLO_STATE__", "__INITIAL_STATE__"]
+HYDRATION_GLOBALS += [g.strip() for g in os.getenv("HYDRATION_GLOBALS_EXTRA", "").split(",") if g.strip()]
+# Per-page "[net]" lines (requests, bytes transferred, blocked, est. bytes saved)
+NET_STATS = os.getenv("NET_STATS", "1").strip().lower() in ("1", "true", "yes")
+# Document-start observer that keeps a copy of every list row as it mounts, so rows
+# the virtualized list has already unmounted are still read (ROW_CAPTURE=0 to disable).
+ROW_CAPTURE = os.getenv("ROW_CAPTURE", "1").strip().lower() in ("1", "true", "yes")
+# JSON the list/detail apps fetch themselves (read back with Network.getResponseBody
+# from the performance log). XHR_URL_RE picks which responses are kept; point it at
+# a local server replaying recorded responses to test. XHR_CAPTURE=0 disables.
+XHR_CAPTURE = os.getenv("XHR_CAPTURE", "1").strip().lower() in ("1", "true", "yes")
+XHR_URL_RE = re.compile(os.getenv("XHR_URL_RE", r"api\.encar\.com/(search|v1)/|/search/car/list|/readside/"), re.I)
+XHR_KEEP = int(os.getenv("XHR_KEEP", "50"))
+XHR_LIST_URL_RE = os.getenv("XHR_LIST_URL_RE", r"search|/list")
+XHR_DETAIL_URL_RE = os.getenv("XHR_DETAIL_URL_RE", r"readside|vehicle|detail")
 
 UPSERT_SQL = """
 INSERT INTO vehicles
@@ -112,6 +313,11 @@ def getenv_float(name, default):
         return float(default)
 
 KRW_EUR = getenv_float("KRW_EUR", 0.000615)
+HTTP_TIMEOUT = getenv_float("HTTP_TIMEOUT", 15)
+# Report URLs are derived from the carid. REPORT_CHECK=1 validates them over HTTP in
+# batches (REPORT_CHECK_BASE + carid, e.g. a local stand-in) and drops missing ones.
+REPORT_CHECK = os.getenv("REPORT_CHECK", "").strip().lower() in ("1", "true", "yes")
+REPORT_CHECK_BASE = os.getenv("REPORT_CHECK_BASE", "").strip()
 FINISH_WORDS_RE = re.compile(
     r'\b(metallic|metal|met|pearl|pearlcoat|pearl\-coat|pearlized|pearly|pearl effect|'
     r'matte|matt|flat|satin|gloss|glossy|solid|standard|classic|premium|effect|'
@@ -120,16 +326,29 @@ FINISH_WORDS_RE = re.compile(
 )
 
 # ---------------- Normalization maps (KR/EN -> AL) ----------------
+# Korean keys cover Encar's own (untranslated) state/DOM values, so TRANSLATE=0
+# produces the same Albanian output as the auto-translated page.
 FUEL_MAP = {
-    "가솔린":"Benzinë","휘발유":"Benzinë","gasoline":"Benzinë",
+    "가솔린":"Benzinë","휘발유":"Benzinë","gasoline":"Benzinë","petrol":"Benzinë",
     "디젤":"Dizel","경유":"Dizel","diesel":"Dizel",
     "하이브리드":"Hibrid","가솔린+전기":"Hibrid","디젤+전기":"Hibrid","hybrid":"Hibrid",
-    "전기":"Elektrik","ev":"Elektrik","elec":"Elektrik",
-    "lpg":"GPL","lp지":"GPL","lpi":"GPL",
+    "가솔린 하이브리드":"Hibrid","디젤 하이브리드":"Hibrid","플러그인 하이브리드":"Hibrid","phev":"Hibrid",
+    "gasoline+electric":"Hibrid","diesel+electric":"Hibrid","plug-in hybrid":"Hibrid",
+    "전기":"Elektrik","ev":"Elektrik","elec":"Elektrik","electric":"Elektrik","electricity":"Elektrik",
+    "lpg":"GPL","lp지":"GPL","lpi":"GPL","lpg(일반인 구입)":"GPL","lpg(일반인구입)":"GPL",
+    "lpg (general public purchase)":"GPL","lpg(general public purchase)":"GPL",
+    "lpg+전기":"GPL","lpg+electric":"GPL","가솔린+lpg":"GPL","gasoline+lpg":"GPL",
+    "수소":"Hidrogjen","hydrogen":"Hidrogjen","수소전기":"Hidrogjen",
+    "cng":"Metan","천연가스":"Metan","gasoline+cng":"Metan","가솔린+cng":"Metan",
+    "기타":"Tjetër","other":"Tjetër",
 }
 TRANS_MAP = {
     "오토":"Automatik","자동":"Automatik","auto":"Automatik","automatic":"Automatik",
-    "수동":"Manual","수동변속기":"Manual","manual":"Manual"
+    "자동변속기":"Automatik","a/t":"Automatik","at":"Automatik",
+    "세미오토":"Automatik","semi-auto":"Automatik","semi auto":"Automatik","semi-automatic":"Automatik",
+    "cvt":"Automatik","무단변속기":"Automatik","dct":"Automatik","듀얼클러치":"Automatik",
+    "수동":"Manual","수동변속기":"Manual","manual":"Manual","m/t":"Manual","mt":"Manual",
+    "기타":"Tjetër","other":"Tjetër",
 }
 
 BODY_TYPE_MAP = {
@@ -149,6 +368,10 @@ BODY_TYPE_MAP = {
     "세단":"Sedan","쿠페":"Kupe","해치백":"Hatchback","왜건":"Karavan","컨버터블":"Kabrio","로드스터":"Kabrio",
     "스파이더":"Kabrio","밴":"Minivan/MPV","승합":"Minivan/MPV","픽업":"Pickup","suv":"SUV",
     "리무진":"Sedan","버스":"Autobus",
+    # Encar 차종 (vehicle class) values
+    "경차":"Hatchback","소형차":"Hatchback","준중형차":"Sedan","중형차":"Sedan","대형차":"Sedan",
+    "스포츠카":"Kupe","미니밴":"Minivan/MPV","승합차":"Minivan/MPV","화물차":"Komerçiale","트럭":"Pickup",
+    "캠핑카":"Minivan/MPV","특장차":"Komerçiale",
 }
 
 COLOR_MAP = {
@@ -171,6 +394,17 @@ COLOR_MAP = {
     "pearl":"E bardhë","pearl white":"E bardhë","진주":"E bardhë","펄":"E bardhë",
     "turquoise":"E gjelbër","aqua":"E gjelbër","cyan":"E gjelbër",
     "multicolor":"Shumëngjyrëshe","multi color":"Shumëngjyrëshe","two tone":"Shumëngjyrëshe","dual tone":"Shumëngjyrëshe",
+    # Encar colour names (state colorName / 색상 cell)
+    "진주색":"E bardhë","흰색투톤":"E bardhë","진주투톤":"E bardhë",
+    "검정투톤":"E zezë","검은색":"E zezë",
+    "은색투톤":"Argjendtë","명은색":"Argjendtë","은하색":"Argjendtë",
+    "은회색":"Gri","진회색":"Gri","회색투톤":"Gri",
+    "빨간색":"E kuqe","적색":"E kuqe","자주색":"Bordo","와인색":"Bordo",
+    "파란색":"Blu","진청색":"Blu","청옥색":"E gjelbër",
+    "녹색":"E gjelbër","초록색":"E gjelbër","담녹색":"E gjelbër","연두색":"E gjelbër",
+    "노란색":"E verdhë","금색":"I artë","연금색":"Shampanjë",
+    "갈대색":"Bezhë","베이지색":"Bezhë","갈색투톤":"Kafe",
+    "보라색":"Vjollcë","분홍색":"Rozë","투톤":"Shumëngjyrëshe",
 }
 
 REPORT_URL_RE = re.compile(r'mdsl_regcar\.do\?method=inspection(View|ImgView|ViewNew)', re.I)
@@ -178,8 +412,15 @@ REPORT_CANON_BASE = "https://www.encar.com/md/sl/mdsl_regcar.do?method=inspectio
 BRAND_MAP = {
     "벤츠":"Mercedes-Benz","메르세데스":"Mercedes-Benz","아우디":"Audi","폭스바겐":"Volkswagen",
     "현대":"Hyundai","기아":"Kia","제네시스":"Genesis","볼보":"Volvo","포드":"Ford","지프":"Jeep",
-    "렉서스":"Lexus","토요타":"Toyota","닛산":"Nissan","혼다":"Honda","스즈키":"Suzuki",
-    "미니":"MINI","포르쉐":"Porsche","캐딜락":"Cadillac","इन피니टी":"Infiniti","쉐보레":"Chevrolet",
+    "렉서스":"Lexus","토요타":"Toyota","도요타":"Toyota","닛산":"Nissan","혼다":"Honda","스즈키":"Suzuki",
+    "미니":"MINI","포르쉐":"Porsche","캐딜락":"Cadillac","인피니티":"Infiniti","쉐보레":"Chevrolet",
+    "비엠더블유":"BMW","르노코리아":"Renault Korea","르노삼성":"Renault Samsung","르노":"Renault",
+    "KG모빌리티":"KG Mobility","쌍용":"SsangYong","GM대우":"Chevrolet","대우":"Daewoo",
+    "랜드로버":"Land Rover","재규어":"Jaguar","푸조":"Peugeot","시트로엥":"Citroen",
+    "테슬라":"Tesla","폴스타":"Polestar","마세라티":"Maserati","페라리":"Ferrari",
+    "람보르기니":"Lamborghini","벤틀리":"Bentley","롤스로이스":"Rolls-Royce","애스턴마틴":"Aston Martin",
+    "맥라렌":"McLaren","링컨":"Lincoln","크라이슬러":"Chrysler","닷지":"Dodge","마쯔다":"Mazda",
+    "미쓰비시":"Mitsubishi","피아트":"Fiat","알파로메오":"Alfa Romeo","스마트":"smart",
 }
 
 BOT_WALL_RX = re.compile(
@@ -350,62 +591,351 @@ def normalize_ad_price_to_krw(ad_price) -> int:
 # ======== /PRICE NORMALIZATION ========
 
 # ---------------- State/DOM helpers ----------------
-def wait_ready(browser, timeout=10):
+# Async-script waiter: resolves on the DOM/readiness signal itself (MutationObserver,
+# readystatechange, load, hashchange) instead of sleeping between polls.
+# __PRED__ is spliced in as a JS expression; bursts of mutations are coalesced.
+WAIT_UNTIL_JS = r"""
+var done = arguments[arguments.length - 1];
+var timeoutMs = arguments[0];
+function check(){ try { return !!(__PRED__); } catch(e){ return false; } }
+if (check()) { done(true); return; }
+var finished = false, pending = false, mo = null, timer = null;
+function finish(v){
+  if (finished) return;
+  finished = true;
+  try { if (mo) mo.disconnect(); } catch(e){}
+  clearTimeout(timer);
+  document.removeEventListener('readystatechange', onSignal, true);
+  window.removeEventListener('load', onSignal, true);
+  window.removeEventListener('hashchange', onSignal, true);
+  done(v);
+}
+function onSignal(){
+  if (finished || pending) return;
+  pending = true;
+  setTimeout(function(){ pending = false; if (check()) finish(true); }, 25);
+}
+try {
+  mo = new MutationObserver(onSignal);
+  mo.observe(document.documentElement || document, {childList:true, subtree:true, characterData:true});
+} catch(e){}
+document.addEventListener('readystatechange', onSignal, true);
+window.addEventListener('load', onSignal, true);
+window.addEventListener('hashchange', onSignal, true);
+timer = setTimeout(function(){ finish(check()); }, timeoutMs);
+"""
+
+def wait_until(browser, predicate_js, timeout=10):
+    """
+    Block until the JS expression `predicate_js` is truthy in the page, or timeout.
+    If the document unloads mid-wait (navigation) the script is re-armed on the new page.
+    """
+    script = WAIT_UNTIL_JS.replace("__PRED__", predicate_js)
     t0 = time.time()
-    while time.time()-t0 < timeout:
+    while True:
+        left = timeout - (time.time() - t0)
+        if left <= 0:
+            return False
         try:
-            if browser.evaluate_script("document.readyState")=="complete":
-                return True
-        except:
-            pass
-        time.sleep(0.2)
-    return False
+            return bool(browser.driver.execute_async_script(script, int(left * 1000)))
+        except Exception:
+            try:
+                if browser.evaluate_script("!!(" + predicate_js + ")"):
+                    return True
+            except Exception:
+                pass
+            time.sleep(min(0.1, max(0.0, left)))
+
+READY_JS = "document.readyState === 'complete'"
+
+# Shared page-side helpers for every hydration format in HYDRATION_GLOBALS.
+# __hydrationPresent() is cheap (no parsing) so wait_until can poll it;
+# __hydrationState() returns {src, state} or null.
+HYDRATION_JS = r"""
+function __hydrationPresent(){
+  var G = __GLOBALS__;
+  for (var i = 0; i < G.length; i++){ try { if (window[G[i]] != null) return true; } catch(e){} }
+  var ss = document.scripts || [];
+  for (var j = 0; j < ss.length; j++){
+    var s = ss[j];
+    if (s.id && G.indexOf(s.id) >= 0) return true;
+    if (/json/i.test(s.type || '') && !/ld\+json/i.test(s.type || '') && (s.text || '').length > 200) return true;
+    var t = s.text || '';
+    for (var k = 0; k < G.length; k++){ if (t.indexOf(G[k]) >= 0) return true; }
+  }
+  return false;
+}
+function __hydrationState(){
+  var G = __GLOBALS__;
+  for (var i = 0; i < G.length; i++){
+    try { var v = window[G[i]]; if (v !== null && typeof v === 'object') return {src: G[i], state: v}; } catch(e){}
+  }
+  var ss = Array.from(document.scripts || []);
+  for (var j = 0; j < ss.length; j++){
+    if (ss[j].id && G.indexOf(ss[j].id) >= 0){
+      try { return {src: ss[j].id, state: JSON.parse(ss[j].text)}; } catch(e){}
+    }
+  }
+  for (var k = 0; k < G.length; k++){
+    var rx = new RegExp(G[k] + '\\s*=\\s*(\\{[\\s\\S]*?\\});');
+    for (var n = 0; n < ss.length; n++){
+      var t = ss[n].text || '';
+      if (t.indexOf(G[k]) < 0) continue;
+      var m = t.match(rx);
+      if (m && m[1]){ try { return {src: G[k], state: (new Function('return (' + m[1] + ')'))()}; } catch(e){} }
+    }
+  }
+  var best = null;
+  ss.forEach(function(s){
+    if (/json/i.test(s.type || '') && !/ld\+json/i.test(s.type || '') && (!best || s.text.length > best.text.length)) best = s;
+  });
+  if (best){ try { return {src: 'inline-json', state: JSON.parse(best.text)}; } catch(e){} }
+  return null;
+}
+""".replace("__GLOBALS__", json.dumps(HYDRATION_GLOBALS))
+
+STATE_PRESENT_JS = "(function(){" + HYDRATION_JS + " return __hydrationPresent(); })()"
+
+GET_STATE_JS = ("(function(){" + HYDRATION_JS +
+                " var h = __hydrationState(); return h ? JSON.stringify(h) : null; })()")
+
+def hydrated_state(src, state):
+    """
+    State from any hydration source, as the collectors expect it. Non-Encar
+    shells (Next.js etc.) tend to carry API-shaped records, which get the same
+    carId/title/price keys as captured XHR payloads.
+    """
+    if not isinstance(state, dict):
+        state = {"data": state} if isinstance(state, list) else {}
+    if src != "__PRELOADED_STATE__":
+        normalize_xhr_payload(state)
+    return state
+
+def wait_ready(browser, timeout=10):
+    return wait_until(browser, READY_JS, timeout)
 
 def wait_for_state(browser, timeout=12):
-    t0 = time.time()
-    js = r"""(function(){
-      if (typeof window.__PRELOADED_STATE__ !== 'undefined') return true;
-      return Array.from(document.scripts||[]).some(s => (s.text||'').indexOf('__PRELOADED_STATE__')>=0);
-    })()"""
-    while time.time()-t0 < timeout:
-        try:
-            if browser.evaluate_script(js):
-                return True
-        except:
-            pass
-        time.sleep(0.25)
-    return False
+    return wait_until(browser, STATE_PRESENT_JS, timeout)
 
 def get_full_state(browser):
+    # Globals, script-id JSON, `X = {...}` literals and inline JSON in one round-trip
     try:
-        s = browser.evaluate_script(
-          "typeof window.__PRELOADED_STATE__!=='undefined'?JSON.stringify(window.__PRELOADED_STATE__):null"
-        )
-        if s:
-            return json.loads(s)
-    except:
-        pass
-    try:
-        code = browser.evaluate_script(r"""
-          (function(){
-            var ss = Array.from(document.scripts||[]);
-            for (var i=0;i<ss.length;i++){
-              var t = ss[i].text||'';
-              if(t.indexOf('__PRELOADED_STATE__')>=0){
-                var m=t.match(/__PRELOADED_STATE__\s*=\s*(\{[\s\S]*?\});/);
-                if(m&&m[1]) return m[1];
-              }
-            } return null;
-          })()""")
-        if code:
-            js_obj = code[:-1] if code.endswith(";") else code
-            raw = browser.evaluate_script("JSON.stringify((" + js_obj + "))")
-            if raw:
-                return json.loads(raw)
+        raw = browser.evaluate_script(GET_STATE_JS)
+        if raw:
+            h = fast_json_loads(raw)
+            return hydrated_state(h.get("src"), h.get("state"))
     except:
         pass
     return {}
 
+# ---------------- Typed decoding (msgspec) ----------------
+# Only the fields the collectors read are declared; msgspec drops every other key
+# while decoding, and omit_defaults keeps absent fields out of to_builtins() so the
+# dict-based collectors see the same keys they would in the raw JSON.
+def fast_json_loads(s):
+    """json.loads, through msgspec's decoder when it is installed."""
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(s)
+        except Exception:
+            pass
+    return json.loads(s)
+
+if msgspec is not None:
+    class ListRecord(msgspec.Struct, omit_defaults=True):
+        title: Any = None
+        name: Any = None
+        carName: Any = None
+        price: Any = None
+        salePrice: Any = None
+        listPrice: Any = None
+        priceText: Any = None
+        link: Any = None
+        href: Any = None
+        carId: Any = None
+        carID: Any = None
+        carNo: Any = None
+        carno: Any = None
+        ModifiedDate: Any = None
+        modifiedDate: Any = None
+        modifyDate: Any = None
+
+    class CarRef(msgspec.Struct, omit_defaults=True):
+        carId: str = ""
+        title: Any = None
+        name: Any = None
+        carName: Any = None
+        price: Any = None
+        salePrice: Any = None
+        listPrice: Any = None
+        priceText: Any = None
+
+    class StateProjection(msgspec.Struct):
+        names: dict[str, Any] = msgspec.field(default_factory=dict)
+        paths: dict[str, Any] = msgspec.field(default_factory=dict)
+        records: list[list[Optional[ListRecord]]] = msgspec.field(default_factory=list)
+        carids: list[CarRef] = msgspec.field(default_factory=list)
+
+    # api.encar.com search responses
+    class SearchPhoto(msgspec.Struct, omit_defaults=True):
+        location: Any = None
+        type: Any = None
+        ordering: Any = None
+
+    class SearchCar(msgspec.Struct, omit_defaults=True):
+        Id: Any = None
+        Manufacturer: Any = None
+        Model: Any = None
+        Badge: Any = None
+        BadgeDetail: Any = None
+        Price: Any = None
+        Mileage: Any = None
+        FormYear: Any = None
+        Year: Any = None
+        FuelType: Any = None
+        Transmission: Any = None
+        Color: Any = None
+        ModifiedDate: Any = None
+        Photo: Any = None
+        Photos: Optional[list[SearchPhoto]] = None
+
+    class SearchPayload(msgspec.Struct, omit_defaults=True):
+        Count: Any = None
+        SearchResults: list[SearchCar] = msgspec.field(default_factory=list)
+
+    _PROJECTION_DEC = msgspec.json.Decoder(StateProjection)
+    _SEARCH_DEC = msgspec.json.Decoder(SearchPayload)
+
+def decode_projection(raw):
+    """STATE_PROJECT_JS output -> plain dict (typed decode when msgspec is present)."""
+    if msgspec is not None:
+        try:
+            return msgspec.to_builtins(_PROJECTION_DEC.decode(raw))
+        except Exception:
+            pass
+    return json.loads(raw)
+
+def decode_xhr_body(text):
+    """
+    XHR JSON -> plain dict. Search responses decode against SearchPayload, so
+    the dozens of unused per-car fields never become Python objects.
+    """
+    if msgspec is not None and '"SearchResults"' in text:
+        try:
+            return msgspec.to_builtins(_SEARCH_DEC.decode(text))
+        except Exception:
+            pass
+    return fast_json_loads(text)
+
+# In-page projection of the state: only the values asked for cross WebDriver.
+#   names   -> first value per key name in document order (what a regex over
+#              JSON.stringify(state) would hit first); ci / numeric options
+#   paths   -> dotted paths ("search.paging.page", "list.0.carId")
+#   records -> the arrays get_list_records_from_state picks, items cut to its keys
+#   carids  -> dicts deep_collect_car_records_from_state picks, cut to its keys
+STATE_PROJECT_JS = r"""(function(spec){""" + HYDRATION_JS + r"""
+  function getState(){
+    var h = __hydrationState();
+    // Only Encar's own state has the key names the projection looks for
+    return h && h.src === '__PRELOADED_STATE__' ? h.state : undefined;
+  }
+  function isObj(v){ return v !== null && typeof v === 'object'; }
+  function pick(o, keys){
+    var r = {};
+    keys.forEach(function(k){ if (Object.prototype.hasOwnProperty.call(o, k)) r[k] = o[k]; });
+    return r;
+  }
+  var st = getState();
+  if (st === undefined || st === null) return null;
+  var out = {names: {}, paths: {}, records: [], carids: []};
+
+  (spec.paths || []).forEach(function(p){
+    var cur = st, parts = String(p).split('.');
+    for (var i = 0; i < parts.length && isObj(cur); i++) cur = cur[parts[i]];
+    if (i === parts.length && cur !== undefined) out.paths[p] = cur;
+  });
+
+  var names = spec.names || [];
+  if (names.length){
+    var want = {}, left = names.length;
+    names.forEach(function(n){ want[spec.ci ? n.toLowerCase() : n] = n; });
+    (function dfs(o){
+      if (!left || !isObj(o)) return;
+      if (Array.isArray(o)){ for (var i = 0; i < o.length && left; i++) dfs(o[i]); return; }
+      for (var k in o){
+        if (!left) return;
+        var n = want[spec.ci ? k.toLowerCase() : k], v = o[k];
+        if (n !== undefined && !(n in out.names) &&
+            (spec.numeric ? (typeof v === 'number' && isFinite(v)) : !isObj(v))){
+          out.names[n] = v; left--;
+        }
+        dfs(v);
+      }
+    })(st);
+  }
+
+  if (spec.records || spec.carids){
+    var REC = ['title','name','carName','price','salePrice','listPrice','link','href','carId','carNo','priceText'];
+    var REC_KEEP = REC.concat(['carID','carno','ModifiedDate','modifiedDate','modifyDate']);
+    var CAR_KEEP = ['title','name','carName','price','salePrice','listPrice','priceText'];
+    var CARID = /car(id|no)\b/i;
+    // [node, reached through a list]: the records walk never looks inside lists
+    var q = [[st, false]], seen = new Set();
+    while (q.length){
+      var ent = q.shift(), cur = ent[0], inList = ent[1];
+      if (seen.has(cur)) continue;
+      seen.add(cur);
+      if (Array.isArray(cur)){
+        if (spec.records && !inList && cur.length && isObj(cur[0]) && !Array.isArray(cur[0]) &&
+            REC.some(function(k){ return k in cur[0]; })){
+          out.records.push(cur.map(function(it){ return isObj(it) && !Array.isArray(it) ? pick(it, REC_KEEP) : null; }));
+        }
+        if (spec.carids) cur.forEach(function(v){ if (isObj(v)) q.push([v, true]); });
+      } else {
+        if (spec.carids){
+          for (var k in cur){
+            if (CARID.test(k.toLowerCase()) && /^\d{6,}$/.test(String(cur[k]).trim())){
+              out.carids.push(Object.assign(pick(cur, CAR_KEEP), {carId: String(cur[k]).trim()}));
+              break;
+            }
+          }
+        }
+        for (var k2 in cur){ if (isObj(cur[k2])) q.push([cur[k2], inList]); }
+      }
+    }
+  }
+  return JSON.stringify(out);
+})(arguments[0])"""
+
+def project_state(browser, names=(), paths=(), records=False, carids=False, ci=False, numeric=False):
+    """
+    Evaluate STATE_PROJECT_JS: {"names", "paths", "records", "carids"} with only
+    the requested values, {} when the page has no state, None if the script failed.
+    """
+    spec = {"names": list(names), "paths": list(paths), "records": records, "carids": carids,
+            "ci": ci, "numeric": numeric}
+    try:
+        raw = browser.driver.execute_script("return " + STATE_PROJECT_JS, spec)
+    except Exception as e:
+        print(f"[state] projection failed: {e}")
+        return None
+    return decode_projection(raw) if raw else {}
+
+def list_state_projection(browser, timeout=3):
+    """
+    Stand-in for get_full_state on list pages: just the car records and
+    carid-bearing dicts, shaped so get_list_records_from_state and
+    deep_collect_car_records_from_state read them as they read the full state.
+    """
+    if not wait_for_state(browser, timeout):
+        return {}
+    pr = project_state(browser, records=True, carids=True)
+    if not pr:
+        # Script failure or another hydration format: take the normalised full state
+        return get_full_state(browser)
+    return {"cars": {f"c{i}": d for i, d in enumerate(pr.get("carids") or [])},
+            "records": {f"r{i}": a for i, a in enumerate(pr.get("records") or [])}}
+
 def list_row_dom_extract(row):
     """
     Minimal, DOM-only extraction from a list row:
@@ -468,38 +998,36 @@ def list_row_dom_extract(row):
     rec["title"] = title_txt
 
     # --- PRICE TEXT + NUM ---
-    # First, try obvious price containers
-    def _pick_price_text():
-        sels = [
-            '.pay', '.price', 'td.price', 'span.price', '[class*="price"]',
-            '[class*="prc"]', '[id*="price"]', '.car_price'
-        ]
-        for sel in sels:
-            try:
-                els = row.find_by_css(sel)
-                if not els:
-                    continue
-                # Find the first element in this selector that parses as a price
-                for el in els:
-                    txt = (el.text or "").strip()
-                    if not txt:
-                        continue
-                    if price_text_to_krw(txt) or re.search(r'[₩￦]|\bwon\b|원|억|만', txt, re.I):
-                        return txt
-            except Exception:
-                pass
-        # Fallback: scan row html with the existing helpers
-        chunks = extract_price_chunks_from_row(rec["row_html"])
+    # Texts of the obvious price containers, in selector priority order
+    texts = []
+    for sel in LIST_PRICE_SELS:
+        try:
+            texts += [(el.text or "").strip() for el in (row.find_by_css(sel) or [])]
+        except Exception:
+            pass
+    rec["priceText"], rec["priceNum"] = list_price_from_texts(texts, rec["row_html"])
+    return rec
+
+LIST_PRICE_SELS = [
+    '.pay', '.price', 'td.price', 'span.price', '[class*="price"]',
+    '[class*="prc"]', '[id*="price"]', '.car_price'
+]
+
+def list_price_from_texts(texts, row_html):
+    """
+    (priceText, priceNum) for a list row from its price-container texts, falling
+    back to scanning the row HTML. priceNum is KRW when it can be coerced.
+    """
+    ptxt = ""
+    for txt in texts or []:
+        if txt and (price_text_to_krw(txt) or re.search(r'[₩￦]|\bwon\b|원|억|만', txt, re.I)):
+            ptxt = txt
+            break
+    if not ptxt:
+        chunks = extract_price_chunks_from_row(row_html)
         if chunks:
             # Prefer a chunk that parses to KRW
-            for c in chunks:
-                if price_text_to_krw(c):
-                    return c
-            return chunks[0]
-        return ""
-
-    ptxt = _pick_price_text()
-    rec["priceText"] = ptxt
+            ptxt = next((c for c in chunks if price_text_to_krw(c)), chunks[0])
 
     # priceNum tries to be numeric KRW (the later pipeline will normalize it anyway)
     pnum = None
@@ -508,17 +1036,161 @@ def list_row_dom_extract(row):
             # If it has KR money tokens, parse; else leave None and let row_html parsing handle it later
             if re.search(r'[₩￦]|\bwon\b|원|억|만', ptxt, re.I):
                 pnum = normalize_ad_price_to_krw(ptxt)
-        if (pnum is None or pnum == 0) and rec["row_html"]:
-            cands = parse_price_candidates_from_html(rec["row_html"])
+        if (pnum is None or pnum == 0) and row_html:
+            cands = parse_price_candidates_from_html(row_html)
             if cands:
                 pnum = pick_best_krw(cands)
     except Exception:
         pnum = None
-    rec["priceNum"] = pnum if pnum else None
+    return ptxt, (pnum if pnum else None)
+
+# Installed with Page.addScriptToEvaluateOnNewDocument: snapshots (deep clones)
+# every tr/li[data-index] into window.__encarRowBuf as it mounts or changes.
+# The buffer is keyed by data-index and reset whenever the list hash changes.
+ROW_CAPTURE_JS = r"""(function(){
+  if (window.__encarRowBuf) return;
+  var buf = window.__encarRowBuf = {hash: location.hash, rows: {}};
+  var SEL = 'tr[data-index], li[data-index]';
+  var dirty = new Set(), timer = null;
+  function flush(){
+    timer = null;
+    if (buf.hash !== location.hash){ buf.hash = location.hash; buf.rows = {}; }
+    dirty.forEach(function(row){
+      var k = row.getAttribute('data-index');
+      if (k !== null && row.isConnected) buf.rows[k] = row.cloneNode(true);
+    });
+    dirty.clear();
+  }
+  function mark(node){
+    if (!node || node.nodeType !== 1) return;
+    var row = node.closest ? node.closest(SEL) : null;
+    if (row) dirty.add(row);
+    if (node.querySelectorAll) node.querySelectorAll(SEL).forEach(function(r){ dirty.add(r); });
+    if (!timer) timer = setTimeout(flush, 30);
+  }
+  new MutationObserver(function(muts){
+    for (var i = 0; i < muts.length; i++){
+      var m = muts[i];
+      mark(m.target.nodeType === 1 ? m.target : m.target.parentElement);
+      for (var j = 0; j < m.addedNodes.length; j++) mark(m.addedNodes[j]);
+    }
+  }).observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+  window.addEventListener('hashchange', function(){ buf.hash = location.hash; buf.rows = {}; });
+})();"""
 
-    return rec
+ROW_BUF_COUNT_JS = ("(function(){ var b = window.__encarRowBuf; if (!b || b.hash !== location.hash) return -1;"
+                    " var n = Object.keys(b.rows).length; document.querySelectorAll('tr[data-index], li[data-index]')"
+                    ".forEach(function(r){ if (!(r.getAttribute('data-index') in b.rows)) n++; }); return n; })()")
+
+def install_row_capture(browser):
+    """
+    Register ROW_CAPTURE_JS for every future document of this tab and start it
+    on the current one. Per-target like all CDP state: call again on new tabs.
+    """
+    if not ROW_CAPTURE:
+        return False
+    d = getattr(browser, "driver", None)
+    try:
+        if d:
+            d.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": ROW_CAPTURE_JS})
+        browser.execute_script(ROW_CAPTURE_JS)
+        return True
+    except Exception:
+        return False
+
+def buffered_row_count(browser) -> int:
+    """Rows seen on this list page so far, mounted or not; -1 without a capture buffer."""
+    try:
+        n = browser.evaluate_script(ROW_BUF_COUNT_JS)
+        return int(n) if n is not None else -1
+    except Exception:
+        return -1
+
+# All list rows of the current page in one round-trip: the same fields
+# list_row_dom_extract / extract_listing_thumb read element by element.
+# Live rows win; rows the list has since unmounted come from __encarRowBuf.
+LIST_PAGE_ROWS_JS = r"""(function(rowSels, priceSels){
+  function T(n){ return ((n && (n.innerText || n.textContent)) || '').trim(); }
+  var rows = [];
+  for (var i = 0; i < rowSels.length && !rows.length; i++){
+    try { rows = Array.from(document.querySelectorAll(rowSels[i])); } catch(e){ rows = []; }
+  }
+  var buf = window.__encarRowBuf;
+  if (buf && buf.hash === location.hash){
+    var live = {};
+    rows.forEach(function(r){ live[r.getAttribute('data-index')] = 1; });
+    Object.keys(buf.rows).forEach(function(k){ if (!live[k]) rows.push(buf.rows[k]); });
+    rows.sort(function(a, b){
+      return (parseInt(a.getAttribute('data-index'), 10) || 0) - (parseInt(b.getAttribute('data-index'), 10) || 0);
+    });
+  }
+  var linkSels = ['td.inf a.newLink._link', 'td.img a.newLink._link', 'a[data-enlog-dt-eventnamegroup="차량상세"]',
+                  'a[href*="/dc/dc_cardetailview"]', 'a[href*="/cars/detail/"]', 'a[href]'];
+  var imgAttrs = ['src','data-src','data-lazy','data-lazy-src','data-original','data-origin'];
+  function pickSrc(img){
+    if (!img) return '';
+    for (var k = 0; k < imgAttrs.length; k++){
+      var v = img.getAttribute(imgAttrs[k]);
+      if (v && v.indexOf('carpicture') >= 0) return img[imgAttrs[k]] || v;
+    }
+    return img.src || '';
+  }
+  return JSON.stringify(rows.map(function(row, idx){
+    var a = null;
+    for (var j = 0; j < linkSels.length && !a; j++) a = row.querySelector(linkSels[j]);
+    var href = a ? (a.href || a.getAttribute('href') || '') : '';
+    var title = a ? T(a).replace(/\s+/g, ' ') : '';
+    var prices = [];
+    priceSels.forEach(function(sel){
+      try { row.querySelectorAll(sel).forEach(function(el){ prices.push(T(el)); }); } catch(e){}
+    });
+    var carid = row.getAttribute('data-carid') || row.getAttribute('data-car-id') || '';
+    if (!carid){
+      var c = row.querySelector('[data-carid],[data-car-id]');
+      if (c) carid = c.getAttribute('data-carid') || c.getAttribute('data-car-id') || '';
+    }
+    return {
+      index: parseInt(row.getAttribute('data-index') || idx, 10),
+      title: title, href: href, prices: prices, carid: carid,
+      thumb: pickSrc(row.querySelector('img.thumb') || row.querySelector('img')),
+      html: row.innerHTML || ''
+    };
+  }));
+})(arguments[0], arguments[1])"""
+
+def list_page_records(browser):
+    """
+    One script call for every row on the page: title, priceText/priceNum, href,
+    thumb, carid and row_html (prices parsed here in Python).
+    """
+    try:
+        raw = browser.driver.execute_script("return " + LIST_PAGE_ROWS_JS,
+                                            [s.strip() for s in LIST_ROWS_SEL.split(",")], LIST_PRICE_SELS)
+        items = json.loads(raw) if raw else []
+    except Exception as e:
+        print(f"[list] bulk row extract failed: {e}")
+        return []
+    out = []
+    for it in items:
+        row_html = it.get("html") or ""
+        ptxt, pnum = list_price_from_texts(it.get("prices") or [], row_html)
+        href = it.get("href") or ""
+        carid = str(it.get("carid") or "").strip()
+        if not re.fullmatch(r'\d{6,}', carid):
+            carid = carid_from_url(href)
+        thumb = it.get("thumb") or ""
+        if thumb:
+            thumb = (upgrade_list(normalize_img_urls([thumb])) or [""])[0]
+        out.append({
+            "idx": it.get("index"), "title": (it.get("title") or "").strip(),
+            "priceText": ptxt, "priceNum": pnum, "href": href,
+            "carid": carid, "thumb": thumb, "row_html": row_html,
+        })
+    return out
 
 def find_first_value(obj, keys):
+    if isinstance(obj, StateIndex):
+        return obj.find_first_value(keys)
     q = deque([obj]); seen=set()
     while q:
         cur=q.popleft()
@@ -535,6 +1207,67 @@ def find_first_value(obj, keys):
                 if isinstance(v,(dict,list)): q.append(v)
     return None
 
+class StateIndex:
+    """
+    One BFS over a state object that answers every lookup the detail scrapers
+    used to make with a walk of their own (about 20 per car): first non-empty
+    value per key, seat-like keys, carid, option lists and string leaves. Each
+    is kept in the order the single-purpose walkers would meet it, so pass an
+    index wherever those functions take a state and the results are identical.
+    """
+    CARID_HINTS = ('carid', 'carno', 'car_id', 'car_no', 'carseq', 'cid')
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.first = {}          # key -> (dict position, value), first non-empty occurrence
+        self.seat_values = []    # values under SEAT_KEY_RE keys
+        self.option_lists = []   # list values under OPTION_KEY_RE keys
+        self.strings = []        # string leaves
+        self.carid = ""
+        q = deque([obj]); seen = set(); pos = 0
+        while q:
+            cur = q.popleft()
+            if id(cur) in seen: continue
+            seen.add(id(cur))
+            if isinstance(cur, dict):
+                pos += 1
+                for k, v in cur.items():
+                    if k not in self.first and v not in (None, "", [], {}, 0):
+                        self.first[k] = (pos, v)
+                    if isinstance(k, str):
+                        if SEAT_KEY_RE.search(k):
+                            self.seat_values.append(v)
+                        if isinstance(v, list) and OPTION_KEY_RE.search(k):
+                            self.option_lists.append(v)
+                    if not self.carid and any(x in str(k).lower() for x in self.CARID_HINTS):
+                        sv = str(v).strip()
+                        if re.fullmatch(r'\d{6,}', sv): self.carid = sv
+                    if isinstance(v, (dict, list)): q.append(v)
+                    elif isinstance(v, str): self.strings.append(v)
+            elif isinstance(cur, list):
+                for v in cur:
+                    if isinstance(v, (dict, list)): q.append(v)
+                    elif isinstance(v, str): self.strings.append(v)
+
+    def find_first_value(self, keys):
+        best = None
+        for k in keys:
+            hit = self.first.get(k)
+            if hit and (best is None or hit[0] < best[0]):
+                best = hit
+        return best[1] if best else None
+
+    def seats(self):
+        for v in self.seat_values:
+            n = _parse_seat_value(v)
+            if n: return n
+            if isinstance(v, dict):
+                for vk in ('value', 'text', 'val'):
+                    if vk in v:
+                        n = _parse_seat_value(v[vk])
+                        if n: return n
+        return 0
+
 # --------- NEW: deep carid harvesting from state ----------
 CARID_KEY_RE = re.compile(r'car(id|no)\b', re.I)
 def deep_collect_car_records_from_state(state):
@@ -591,7 +1324,17 @@ def deep_collect_car_records_from_state(state):
 def synth_detail_url(carid: str) -> str:
     carid = str(carid).strip()
     if not re.fullmatch(r'\d{6,}', carid): return ""
-    return f"https://fem.encar.com/cars/detail/{carid}"
+    return f"{DETAIL_URL_BASE}{carid}"
+
+def detail_fetch_url(carid: str, fallback: str = "") -> str:
+    """Where the HTTP fast path GETs a car's detail page (DETAIL_FETCH_BASE)."""
+    carid = str(carid or "").strip()
+    if not re.fullmatch(r'\d{6,}', carid): return fallback
+    return f"{DETAIL_FETCH_BASE}{carid}"
+
+def carid_from_url(u: str) -> str:
+    m = re.search(r'/detail/(\d{6,})|[?&]carid=(\d{6,})', u or "", re.I)
+    return (m.group(1) or m.group(2)) if m else ""
 
 def synth_legacy_detail_url(carid: str) -> str:
     carid = str(carid).strip()
@@ -641,17 +1384,12 @@ def body_type_from_title(title: str) -> str:
     return guess_bodytype_from_text(title or "")
 
 # ---------------- Ensure translation ----------------
+NOT_KOREAN_JS = r"!/[\uac00-\ud7a3]/.test(document.body ? document.body.innerText.slice(0,5000) : '')"
+
 def ensure_english(browser, timeout=6):
-    t0 = time.time()
-    while time.time()-t0 < timeout:
-        try:
-            body = browser.evaluate_script("document.body?document.body.innerText.slice(0,5000):''") or ""
-            if not is_korean(body):
-                return True
-        except:
-            pass
-        time.sleep(0.4)
-    return False
+    if not TRANSLATE:
+        return True
+    return wait_until(browser, NOT_KOREAN_JS, timeout)
 
 # ---------------- ALERT-SAFE URL HELPERS ----------------
 def _handle_alert_if_any(browser):
@@ -680,6 +1418,16 @@ def safe_current_url(browser) -> str:
         return ""
 
 # ---------- List row helpers (Encar DOM) ----------
+def live_row_by_index(rows, idx):
+    """The mounted row with data-index == idx (None if the list has unmounted it)."""
+    for r in rows or []:
+        try:
+            if str(r["data-index"]) == str(idx):
+                return r
+        except Exception:
+            continue
+    return None
+
 def find_list_rows(browser):
     """
     Encar renders rows under <tbody id="sr_normal"> as tr[data-index].
@@ -700,25 +1448,33 @@ def find_list_rows(browser):
             pass
     return []
 
+ANY_DETAIL_LINKS_JS = r"""
+(function(){
+  function isDetail(h){ return /\/cars\/detail\/\d+/.test(h) || /dc_cardetailview/.test(h) || /carid=\d{6,}/.test(h); }
+  var a = Array.from(document.querySelectorAll('a[href]')).some(el => {
+    var h = el.getAttribute('href')||'';
+    if (!h) return false;
+    var abs; try{ var t=document.createElement('a'); t.href=h; abs=t.href; }catch(e){ abs=h; }
+    return isDetail(h) || isDetail(abs);
+  });
+  if (a) return true;
+  var b = Array.from(document.querySelectorAll('[data-carid],[data-car-id],[data-carno],[data-car-no]')).length > 0;
+  if (b) return true;
+  var txt = document.body ? document.body.innerText : '';
+  return /carid\s*=\s*\d{6,}/i.test(txt);
+})()
+"""
+
+LIST_ROWS_SEL = "tbody#sr_normal tr[data-index], table#sr_normal tr[data-index], tr[data-index], li[data-index]"
+
+# Cheap fingerprint of the rendered list: first/last row text + count.
+LIST_SIGNATURE_JS = ("(function(){ var r=document.querySelectorAll('" + LIST_ROWS_SEL + "');"
+                     " return r.length ? r.length + '|' + (r[0].innerText||'').slice(0,80) + '|' +"
+                     " (r[r.length-1].innerText||'').slice(0,80) : ''; })()")
+
 def any_detail_links(browser) -> bool:
-    js = r"""
-    (function(){
-      function isDetail(h){ return /\/cars\/detail\/\d+/.test(h) || /dc_cardetailview/.test(h) || /carid=\d{6,}/.test(h); }
-      var a = Array.from(document.querySelectorAll('a[href]')).some(el => {
-        var h = el.getAttribute('href')||'';
-        if (!h) return false;
-        var abs; try{ var t=document.createElement('a'); t.href=h; abs=t.href; }catch(e){ abs=h; }
-        return isDetail(h) || isDetail(abs);
-      });
-      if (a) return true;
-      var b = Array.from(document.querySelectorAll('[data-carid],[data-car-id],[data-carno],[data-car-no]')).length > 0;
-      if (b) return true;
-      var txt = document.body ? document.body.innerText : '';
-      return /carid\s*=\s*\d{6,}/i.test(txt);
-    })()
-    """
     try:
-        return bool(browser.evaluate_script(js))
+        return bool(browser.evaluate_script(ANY_DETAIL_LINKS_JS))
     except Exception:
         return False
 
@@ -793,13 +1549,16 @@ def wait_for_list(browser, timeout=15) -> bool:
         time.sleep(0.4)
     return False
 
-def force_load_list_rows(browser, want=PER_PAGE, max_scrolls=24, pause=0.35) -> int:
+def force_load_list_rows(browser, want=None, max_scrolls=24, pause=0.35) -> int:
     """
-    Scroll until at least `want` rows exist (or attempts exhausted). Click a 'more' control if found.
+    Scroll until at least `want` rows exist (default: the probed page size) or
+    attempts are exhausted. Click a 'more' control if found.
     """
+    want = want or list_page_size()
     def row_count() -> int:
+        # Rows already captured count too: the virtualized list drops them as it scrolls
         try:
-            return len(find_list_rows(browser))
+            return max(len(find_list_rows(browser)), buffered_row_count(browser))
         except Exception:
             return 0
 
@@ -848,6 +1607,8 @@ def force_load_list_rows(browser, want=PER_PAGE, max_scrolls=24, pause=0.35) ->
 
 # ---------------- Images ----------------
 def deep_collect_carpicture_paths(obj):
+    if isinstance(obj, StateIndex):
+        return [v for v in obj.strings if "carpicture" in v]
     out=[]; q=deque([obj])
     while q:
         n=q.popleft()
@@ -919,8 +1680,7 @@ def trigger_lazy_gallery(browser):
         browser.execute_script("window.scrollTo(0,0)"); time.sleep(0.3)
     except: pass
 
-def dom_collect_all_imgs(browser):
-    js = r"""(function(){
+DOM_IMGS_JS = r"""(function(){
       function add(L,u){ if(u && u.indexOf('carpicture')>-1) L.push(u); }
       var urls=[];
       Array.from(document.querySelectorAll('img')).forEach(function(img){
@@ -940,8 +1700,10 @@ def dom_collect_all_imgs(browser):
       });
       return JSON.stringify(urls);
     })()"""
+
+def dom_collect_all_imgs(browser):
     try:
-        res = browser.evaluate_script(js)
+        res = browser.evaluate_script(DOM_IMGS_JS)
         if isinstance(res, str):
             try:
                 parsed = json.loads(res)
@@ -952,6 +1714,16 @@ def dom_collect_all_imgs(browser):
     except Exception:
         return []
 
+BODYTYPE_CHIPS_JS = r"""
+  (function(){
+    var sel=['[class*="breadcrumb"]','[class*="path"]','[class*="chip"]',
+             '[class*="spec"]','[class*="summary"]','[class*="tag"]'];
+    var out=[];
+    sel.forEach(s=>Array.from(document.querySelectorAll(s)).forEach(n=>out.push(n.innerText||'')));
+    return out.join(' | ');
+  })()
+"""
+
 def extract_bodytype_freeform(browser):
     texts = []
     try:
@@ -961,15 +1733,7 @@ def extract_bodytype_freeform(browser):
         texts.append(browser.evaluate_script("document.querySelector('meta[name=\"description\"]')?.content||''") or "")
     except: pass
     try:
-        texts.append(browser.evaluate_script("""
-          (function(){
-            var sel=['[class*="breadcrumb"]','[class*="path"]','[class*="chip"]',
-                     '[class*="spec"]','[class*="summary"]','[class*="tag"]'];
-            var out=[];
-            sel.forEach(s=>Array.from(document.querySelectorAll(s)).forEach(n=>out.push(n.innerText||''));
-            return out.join(' | ');
-          })()
-        """) or "")
+        texts.append(browser.evaluate_script(BODYTYPE_CHIPS_JS) or "")
     except: pass
 
     for t in texts:
@@ -983,6 +1747,9 @@ def build_all_images(browser, state, want_count=20):
     trigger_lazy_gallery(browser)
     d = dom_collect_all_imgs(browser)
 
+    return merge_image_sources(j, d, want_count)
+
+def merge_image_sources(j, d, want_count=20):
     if not isinstance(j, list):
         j = [j] if j else []
     if not isinstance(d, list):
@@ -1000,8 +1767,7 @@ def build_all_images(browser, state, want_count=20):
     return urls[:want_count] if want_count else urls
 
 # ---------------- DOM fallback & seats freeform ----------------
-def dom_fallback_specs(browser):
-    js = r"""(function(){
+DOM_SPECS_JS = r"""(function(){
       function txt(el){return (el&&el.textContent||'').trim();}
       var out={}, pairs=[];
       document.querySelectorAll('dt').forEach(function(dt){
@@ -1044,29 +1810,32 @@ def dom_fallback_specs(browser):
       }
       return out;
     })()"""
+
+def dom_fallback_specs(browser):
     try:
-        return browser.evaluate_script(js) or {}
+        return browser.evaluate_script(DOM_SPECS_JS) or {}
     except Exception:
         return {}
 
+def scan_seats_text(s):
+    if not s: return ""
+    t = s.replace("\u00a0"," ").lower()
+    pats = [
+        r'(?:좌석|승차정원|승차인원|탑승정원|탑승인원|정원)\s*[:：]?\s*(\d{1,2})\s*명?',
+        r'(\d{1,2})\s*인\s*승',
+        r'(\d{1,2})\s*인승',
+        r'\bseating\s*capacity\s*[:：]?\s*(\d{1,2})\b',
+        r'\b(\d{1,2})\s*-\s*seater\b',
+        r'\b(\d{1,2})\s*seaters?\b',
+        r'\bseats?\s*[:：]?\s*(\d{1,2})\b',
+        r'\b(\d{1,2})\s*(?:passengers|people|occupants)\b',
+    ]
+    for p in pats:
+        m = re.search(p, t, re.I)
+        if m: return m.group(1)
+    return ""
+
 def extract_seats_freeform(browser):
-    def scan(s):
-        if not s: return ""
-        t = s.replace("\u00a0"," ").lower()
-        pats = [
-            r'(?:좌석|승차정원|승차인원|탑승정원|탑승인원|정원)\s*[:：]?\s*(\d{1,2})\s*명?',
-            r'(\d{1,2})\s*인\s*승',
-            r'(\d{1,2})\s*인승',
-            r'\bseating\s*capacity\s*[:：]?\s*(\d{1,2})\b',
-            r'\b(\d{1,2})\s*-\s*seater\b',
-            r'\b(\d{1,2})\s*seaters?\b',
-            r'\bseats?\s*[:：]?\s*(\d{1,2})\b',
-            r'\b(\d{1,2})\s*(?:passengers|people|occupants)\b',
-        ]
-        for p in pats:
-            m = re.search(p, t, re.I)
-            if m: return m.group(1)
-        return ""
     try:
         body = browser.evaluate_script("document.body?document.body.innerText:''") or ""
     except Exception:
@@ -1075,7 +1844,7 @@ def extract_seats_freeform(browser):
         meta = browser.evaluate_script("document.querySelector('meta[name=\"description\"]')?.content||''") or ""
     except Exception:
         meta = ""
-    return scan(body) or scan(meta) or ""
+    return scan_seats_text(body) or scan_seats_text(meta) or ""
 
 SEAT_KEY_RE = re.compile(r'(seat|seats|seater|승차|탑승|정원|인승|인원|좌석)', re.I)
 
@@ -1094,6 +1863,8 @@ def _parse_seat_value(v):
     return 0
 
 def deep_find_seats_in_state(obj):
+    if isinstance(obj, StateIndex):
+        return obj.seats()
     q = deque([obj]); seen = set()
     while q:
         cur = q.popleft()
@@ -1120,12 +1891,17 @@ def deep_find_seats_in_state(obj):
 
 def guess_seats_from_page(browser):
     try:
-        txt = (browser.evaluate_script("document.body ? document.body.innerText : ''") or "").lower()
+        txt = browser.evaluate_script("document.body ? document.body.innerText : ''") or ""
     except Exception:
         txt = ""
+    return guess_seats_from_text(txt)
+
+def guess_seats_from_text(txt):
+    txt = (txt or "").lower()
     for pat in [
         r'\b(\d{1,2})\s*-\s*seater\b', r'\b(\d{1,2})\s*seaters?\b',
-        r'\bseats?\s*[:：]?\s*(\d{1,2})\b', r'\b(\d{1,2})\s*(?:passengers|people|occupants)\b'
+        r'\bseats?\s*[:：]?\s*(\d{1,2})\b', r'\b(\d{1,2})\s*(?:passengers|people|occupants)\b',
+        r'(\d{1,2})\s*인\s*승', r'(?:승차|탑승)\s*(?:정원|인원)\s*[:：]?\s*(\d{1,2})'
     ]:
         m = re.search(pat, txt, re.I)
         if m:
@@ -1134,11 +1910,11 @@ def guess_seats_from_page(browser):
     if re.search(r'\b(7\s*seater|seven[- ]seater)\b', txt): return 7
     if re.search(r'\b(8\s*seater|eight[- ]seater)\b', txt): return 8
     if re.search(r'\b(9\s*seater|nine[- ]seater)\b', txt): return 9
-    if re.search(r'\b(roadster|speedster)\b', txt): return 2
-    if re.search(r'\b(convertible|cabrio)\b', txt): return 4
-    if re.search(r'\b(coupe)\b', txt): return 4
-    if re.search(r'\b(mpv|minivan|passenger van)\b', txt): return 7
-    if re.search(r'\b(suv|wagon|estate|touring|hatchback|sedan|saloon|limousine)\b', txt): return 5
+    if re.search(r'\b(roadster|speedster)\b|로드스터', txt): return 2
+    if re.search(r'\b(convertible|cabrio)\b|컨버터블|카브리올레', txt): return 4
+    if re.search(r'\b(coupe)\b|쿠페', txt): return 4
+    if re.search(r'\b(mpv|minivan|passenger van)\b|미니밴|승합', txt): return 7
+    if re.search(r'\b(suv|wagon|estate|touring|hatchback|sedan|saloon|limousine)\b|세단|해치백|왜건|리무진', txt): return 5
     return 0
 
 # --------- "In detail" scraping (COLOR / SEATS only) ----------
@@ -1196,7 +1972,11 @@ def _get_inline_panel_html(browser, row_index):
     except Exception:
         return {"text":"", "html":""}
 
-INLINE_SEATS_RE = re.compile(r'(\d{1,2})\s*-\s*seater|\bseats?\s*[: ]*(\d{1,2})\b', re.I)
+INLINE_SEATS_RE = re.compile(
+    r'(\d{1,2})\s*-\s*seater|\bseats?\s*[: ]*(\d{1,2})\b|(\d{1,2})\s*인\s*승|'
+    r'(?:승차|탑승)\s*(?:정원|인원)\s*[:：]?\s*(\d{1,2})',
+    re.I
+)
 
 def parse_inline_detail_values(panel):
     text = panel.get("text","") or ""
@@ -1240,9 +2020,126 @@ def parse_inline_detail_values(panel):
 
     return out
 
+# Page-wide "In detail" harvester: one async script expands each requested row's
+# panel in turn, waits for it via MutationObserver (not a busy loop, which would
+# block React from rendering it), and returns panel text/html plus any report
+# links in the panel markup. Report buttons are not clicked, so no tabs open.
+INLINE_PANELS_JS = r"""
+var done = arguments[arguments.length - 1];
+var wanted = arguments[0];
+var perRowMs = arguments[1] || 1200;
+function T(n){ return (n && n.innerText) || ''; }
+function abs(u){ try{ var a=document.createElement('a'); a.href=u; return a.href; }catch(e){ return u||''; } }
+var REPORT_RE = /inspectionView|inspection|mdsl_regcar|report|record|성능|점검|기록부/i;
+function findBtn(row, idx){
+  var btn = row.querySelector('button.DetailSummary_btn_detail__msm-h') ||
+            row.querySelector('button[class^="DetailSummary_btn_detail__"][data-enlog-dt-eventnamegroup="기본정보"]');
+  if (!btn){
+    btn = Array.from(row.querySelectorAll('button, a')).find(function(el){
+      return /in detail|detail|상세|자세히|상세보기/.test((el.textContent||'').toLowerCase());
+    });
+  }
+  if (!btn){
+    btn = Array.from(document.querySelectorAll('button[class^="DetailSummary_btn_detail__"]')).find(function(el){
+      var r = el.closest('tr[data-index]');
+      return r && r.getAttribute('data-index') == String(idx);
+    });
+  }
+  return btn || null;
+}
+function findPanel(idx, prevText){
+  var own = ['tr[data-index="'+idx+'"] + tr.sub', 'tr[data-index="'+idx+'"] ~ tr.sub',
+             'tr[data-index="'+idx+'"] [class*="detail"]', 'tr[data-index="'+idx+'"] [class*="spec"]'];
+  for (var i=0;i<own.length;i++){ var p = document.querySelector(own[i]); if (p && T(p)) return p; }
+  // shared layers/popups are reused between rows: only accept one showing new content
+  var shared = ['[class*="layer"] [class*="cont"]', '[class*="popup"] [class*="cont"]', '.detail_layer, .info_layer, .spec_layer'];
+  for (var j=0;j<shared.length;j++){ var q = document.querySelector(shared[j]); if (q && T(q) && T(q) !== prevText) return q; }
+  return null;
+}
+function waitPanel(idx, prevText){
+  return new Promise(function(resolve){
+    var p = findPanel(idx, prevText);
+    if (p) return resolve(p);
+    var timer = null;
+    var mo = new MutationObserver(function(){
+      var q = findPanel(idx, prevText);
+      if (q){ mo.disconnect(); clearTimeout(timer); resolve(q); }
+    });
+    mo.observe(document.body || document.documentElement, {childList:true, subtree:true, characterData:true});
+    timer = setTimeout(function(){ mo.disconnect(); resolve(findPanel(idx, prevText)); }, perRowMs);
+  });
+}
+function reportLinks(panel){
+  var out = [];
+  Array.from(panel.querySelectorAll('a[href], [data-href], [data-url], [onclick]')).forEach(function(el){
+    var h = el.getAttribute('href') || el.getAttribute('data-href') || el.getAttribute('data-url') || '';
+    if (!h){ var m = /['"]([^'"]*(?:inspection|mdsl_regcar)[^'"]*)['"]/i.exec(el.getAttribute('onclick')||''); if (m) h = m[1]; }
+    var label = (el.textContent||'') + ' ' + (el.getAttribute('data-enlog-dt-eventnamegroup')||'');
+    if (h && !/^javascript:/i.test(h) && (REPORT_RE.test(h) || REPORT_RE.test(label))) out.push(abs(h));
+  });
+  return out;
+}
+(async function(){
+  var out = {}, prevText = '';
+  var rows = Array.from(document.querySelectorAll('tr[data-index]'));
+  for (var i=0;i<rows.length;i++){
+    var idx = rows[i].getAttribute('data-index');
+    if (wanted && wanted.indexOf(parseInt(idx,10)) < 0) continue;
+    var rec = {text:'', html:'', reports:[], button:false};
+    try {
+      var btn = findBtn(rows[i], idx);
+      if (btn){
+        rec.button = true;
+        try{ btn.scrollIntoView({block:'center'}); }catch(e){}
+        try{ btn.click(); }catch(e){ try{ btn.dispatchEvent(new MouseEvent('click',{bubbles:true})); }catch(_e){} }
+        var panel = await waitPanel(idx, prevText);
+        if (panel){
+          rec.text = T(panel); rec.html = panel.innerHTML || '';
+          rec.reports = reportLinks(panel);
+          prevText = rec.text;
+        }
+      }
+    } catch(e){}
+    out[idx] = rec;
+  }
+  return out;
+})().then(function(out){ done(JSON.stringify(out)); }, function(){ done(null); });
+"""
+
+def harvest_inline_panels(browser, indices=None, per_row_ms=1200):
+    """
+    Color / seats / report link for every requested list row in one round-trip.
+    Returns {row_index: {"color_raw", "seats", "report_url"}}, or None when the
+    script itself failed (callers then fall back to the per-row helpers).
+    """
+    indices = list(indices) if indices is not None else None
+    budget = (len(indices) if indices is not None else list_page_size()) * per_row_ms / 1000.0 + 10
+    try:
+        browser.driver.set_script_timeout(max(45, budget))
+        res = browser.driver.execute_async_script(INLINE_PANELS_JS, indices, int(per_row_ms))
+        panels = json.loads(res) if res else None
+    except Exception as e:
+        print(f"[inline] batch harvest failed: {e}")
+        return None
+    finally:
+        try: browser.driver.set_script_timeout(45)
+        except Exception: pass
+    if not isinstance(panels, dict):
+        return None
+    out = {}
+    for k, p in panels.items():
+        try:
+            idx = int(k)
+        except Exception:
+            continue
+        vals = parse_inline_detail_values(p or {})
+        reports = [u for u in (p or {}).get("reports") or [] if REPORT_URL_RE.search(u) or "inspection" in u.lower()]
+        out[idx] = {"color_raw": vals.get("color_raw") or "", "seats": vals.get("seats") or 0,
+                    "report_url": reports[0] if reports else ""}
+    return out
+
 def get_inline_report_url(browser, row_index):
     _ = _get_inline_panel_html(browser, row_index)
-    time.sleep(0.25)
 
     try:
         browser.evaluate_script(r"""
@@ -1377,6 +2274,9 @@ def get_inline_report_url(browser, row_index):
     return ""
 
 def deep_collect_report_links_from_state(obj):
+    if isinstance(obj, StateIndex):
+        return dedup(v for v in obj.strings
+                     if re.search(r'https?://', v) and re.search(r'(report|inspection|record|pdf|성능|점검|기록부)', v, re.I))
     urls=[]; q=deque([obj]); seen=set()
     while q:
         cur=q.popleft()
@@ -1436,8 +2336,7 @@ def try_click_and_grab_report(browser):
         pass
     return None
 
-def dom_collect_options_and_report(browser):
-    js=r"""(function(){
+DOM_OPTIONS_REPORT_JS = r"""(function(){
       function txt(el){return (el&&el.textContent||'').replace(/\s+/g,' ').trim();}
       function add(arr, t){
         if(!t) return;
@@ -1479,8 +2378,10 @@ def dom_collect_options_and_report(browser):
       });
       return out;
     })()"""
+
+def dom_collect_options_and_report(browser):
     try:
-        obj = browser.evaluate_script(js) or {}
+        obj = browser.evaluate_script(DOM_OPTIONS_REPORT_JS) or {}
     except:
         obj = {}
     features = obj.get("features", []) if isinstance(obj, dict) else []
@@ -1488,6 +2389,20 @@ def dom_collect_options_and_report(browser):
     return dedup(features), dedup(reports)
 
 # ------------- LIST PAGE: brand/model/variant/price -------------
+def brand_to_latin(brand: str) -> str:
+    for k, v in BRAND_MAP.items():
+        if k in (brand or ""):
+            return v
+    return brand or ""
+
+def prefer_latin(hint, fallback):
+    # Untranslated list titles leave Korean hints; a romanised state name wins then.
+    hint = str(hint or "").strip()
+    fallback = str(fallback or "").strip()
+    if is_korean(hint) and fallback and not is_korean(fallback):
+        return fallback
+    return hint or fallback
+
 def parse_title_brand_model_variant(title: str):
     if not title:
         return "", "", ""
@@ -1495,11 +2410,7 @@ def parse_title_brand_model_variant(title: str):
     toks = t.split(" ")
     if len(toks) == 1:
         return toks[0], "", ""
-    brand = toks[0]
-    for k, v in BRAND_MAP.items():
-        if k in brand:
-            brand = v
-            break
+    brand = brand_to_latin(toks[0])
     idx = None
     for i in range(1, len(toks)):
         token = toks[i]
@@ -1555,7 +2466,8 @@ def get_list_records_from_state(state):
                         href = it.get("link") or it.get("href") or ""
                         carid = str(it.get("carId") or it.get("carID") or it.get("carNo") or it.get("carno") or "").strip()
                         if not re.fullmatch(r'\d{6,}', carid): carid = ""
-                        results.append({"idx": i, "title": str(title), "priceText": str(ptxt), "priceNum": pnum, "href": href, "carid": carid})
+                        modified = modified_key(it.get("ModifiedDate") or it.get("modifiedDate") or it.get("modifyDate") or "")
+                        results.append({"idx": i, "title": str(title), "priceText": str(ptxt), "priceNum": pnum, "href": href, "carid": carid, "modified": modified})
     return results
 
 PRICE_CELL_RE = re.compile(
@@ -1627,8 +2539,8 @@ def parse_list_price_eur(price_text: str, price_num, row_html: str):
     return krw, krw_to_eur(krw)
 
 def _extract_carid_from_state_or_url(state, url: str) -> str:
-    cand = None
-    q = deque([state]); seen=set()
+    cand = state.carid if isinstance(state, StateIndex) else None
+    q = deque([] if isinstance(state, StateIndex) else [state]); seen=set()
     while q and not cand:
         cur = q.popleft()
         if id(cur) in seen: continue
@@ -1657,40 +2569,187 @@ def _extract_carid_from_state_or_url(state, url: str) -> str:
     return cand or ""
 
 def _build_report_url_from_carid(carid: str) -> str:
-    if not carid: return ""
-    return f"https://www.encar.com/md/sl/mdsl_regcar.do?method=inspectionViewNew&carid={carid}"
+    return resolve_report_url(carid)
+
+# ------------- Report URL resolver (carid -> canonical link, no clicks) -------------
+REPORT_MISSING_RE = re.compile(r'성능\s*점검[^<]{0,40}없|존재하지\s*않|not\s+found|no\s+inspection', re.I)
+_REPORT_OK = {}                 # carid -> bool, filled by validate_report_urls
+_REPORT_OK_LOCK = threading.Lock()
+
+def _report_exists(carid: str) -> bool:
+    url = (REPORT_CHECK_BASE or REPORT_CANON_BASE) + carid
+    try:
+        r = http_pool().request("GET", url, redirect=True)
+    except Exception:
+        return True    # network trouble is not evidence the report is missing
+    if r.status == 404 or r.status == 410:
+        return False
+    if r.status != 200:
+        return True
+    return not REPORT_MISSING_RE.search(r.data[:200_000].decode("utf-8", "replace"))
+
+def validate_report_urls(carids):
+    """
+    Check report existence for many carids at once over the shared HTTP pool.
+    Results are cached for the run; returns {carid: bool}.
+    """
+    wanted = [c for c in dedup(str(c) for c in carids if c) if re.fullmatch(r'\d{6,}', c)]
+    with _REPORT_OK_LOCK:
+        todo = [c for c in wanted if c not in _REPORT_OK]
+    if todo:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max(1, HTTP_POOL_SIZE)) as ex:
+            found = dict(zip(todo, ex.map(_report_exists, todo)))
+        with _REPORT_OK_LOCK:
+            _REPORT_OK.update(found)
+        missing = [c for c, ok in found.items() if not ok]
+        print(f"[report] validated {len(todo)} carids, {len(missing)} without a report")
+    with _REPORT_OK_LOCK:
+        return {c: _REPORT_OK.get(c, True) for c in wanted}
+
+def resolve_report_url(carid) -> str:
+    """
+    Canonical inspection-report URL for a carid; "" when the carid is unusable
+    or (with REPORT_CHECK) the report is known not to exist.
+    """
+    carid = str(carid or "").strip()
+    if not re.fullmatch(r'\d{6,}', carid):
+        return ""
+    if REPORT_CHECK and not validate_report_urls([carid]).get(carid, True):
+        return ""
+    return f"{REPORT_CANON_BASE}{carid}"
 
 # ------------- DETAIL PAGE: scrape raw fields -------------
-def scrape_detail_raw(browser):
-    wait_ready(browser, timeout=12); ensure_english(browser, 4)
-    st = get_full_state(browser) if wait_for_state(browser, 6) else {}
-
-    manufacturer = find_first_value(st, ["manufacturerName","makerName","brandName"])
-    model        = find_first_value(st, ["modelName"])
-    grade        = find_first_value(st, ["badgeName","grade","gradeName","trimName"])
-    form_year    = find_first_value(st, ["formYear","modelYear"])
-    year_month   = find_first_value(st, ["yearMonth","ym"])
-
-    ad_price     = find_first_value(st, ["price","salePrice","listPrice"])
-    mileage      = find_first_value(st, ["mileage","odo","odometer"])
-    fuel         = find_first_value(st, ["fuelName","fuelTypeName","fuel"])
-    color        = find_first_value(st, ["colorName","exteriorColor"])
-    transmission = find_first_value(st, ["transmissionName","transmission","gearbox"])
-    body_type = find_first_value(
-        st, ["bodyType","vehicleType","carType","body","차종","차형","바디타입"]
-    )
+def state_detail_fields(st, index=True):
+    """
+    Every detail field we can read straight from __PRELOADED_STATE__.
+    Shared by the Selenium path and the browser-free HTTP path. Lookups go
+    through one StateIndex (index=False: one walk per field, for benchmarks).
+    """
+    if index and not isinstance(st, StateIndex):
+        st = StateIndex(st)
     seats = find_first_value(
         st, ["seatCount","seats","seatCnt","seat_cnt","riderCnt","ridePerson",
              "rideCount","rideCnt","personCnt","occupancy","capacity","승차정원","인승","좌석"]
     )
     if not seats:
         seats = deep_find_seats_in_state(st)
+    def names(english, keys):
+        # Untranslated pages keep Korean in *Name: only then prefer Encar's romanised keys
+        return keys if TRANSLATE else english + keys
+    return {
+        "manufacturer": find_first_value(st, names(["manufacturerEnglishName"], ["manufacturerName","makerName","brandName"])),
+        "model":        find_first_value(st, names(["modelEnglishName","modelGroupEnglishName"], ["modelName"])),
+        "grade":        find_first_value(st, names(["gradeEnglishName"], ["badgeName","grade","gradeName","trimName"])),
+        "form_year":    find_first_value(st, ["formYear","modelYear"]),
+        "year_month":   find_first_value(st, ["yearMonth","ym"]),
+        "ad_price":     find_first_value(st, ["price","salePrice","listPrice"]),
+        "mileage":      find_first_value(st, ["mileage","odo","odometer"]),
+        "fuel":         find_first_value(st, ["fuelName","fuelTypeName","fuel"]),
+        "color":        find_first_value(st, ["colorName","exteriorColor"]),
+        "transmission": find_first_value(st, ["transmissionName","transmission","gearbox"]),
+        "body_type":    find_first_value(st, ["bodyType","vehicleType","carType","body","차종","차형","바디타입"]),
+        "seats":        seats,
+        "vin":          find_first_value(st, ["vin","vehicleId","vinNo"]),
+        "engine_cc":    find_first_value(st, ["displacement","engineCC","cc"]),
+    }
 
-    vin          = find_first_value(st, ["vin","vehicleId","vinNo"])
-    engine_cc    = find_first_value(st, ["displacement","engineCC","cc"])
-
-    specs = dom_fallback_specs(browser)
-    seats_free = extract_seats_freeform(browser)
+# One async script per car: scroll the gallery, then return state, spec pairs,
+# body/meta text, image URLs, options and report links in a single payload.
+DETAIL_BUNDLE_JS = r"""
+var done = arguments[arguments.length - 1];
+var steps = arguments[0] || 0;
+function safe(fn, dflt){ try{ var v = fn(); return (v === undefined || v === null) ? dflt : v; }catch(e){ return dflt; } }
+""" + HYDRATION_JS + r"""
+function collect(){
+  var out = {url: location.href};
+  var h = safe(function(){ return __hydrationState(); }, null);
+  out.state = h ? safe(function(){ return JSON.stringify(h.state); }, null) : null;
+  out.stateSrc = h ? h.src : '';
+  out.specs    = safe(function(){ return (""" + DOM_SPECS_JS + """); }, {});
+  out.bodyText = safe(function(){ return document.body ? document.body.innerText : ''; }, '');
+  out.meta     = safe(function(){ var m = document.querySelector('meta[name="description"]'); return m ? m.content : ''; }, '');
+  out.chips    = safe(function(){ return (""" + BODYTYPE_CHIPS_JS + """); }, '');
+  out.images   = safe(function(){ return JSON.parse(""" + DOM_IMGS_JS + """); }, []);
+  var optrep   = safe(function(){ return (""" + DOM_OPTIONS_REPORT_JS + """); }, {});
+  out.features = optrep.features || [];
+  out.reports  = optrep.reports || [];
+  done(JSON.stringify(out));
+}
+var i = 0;
+(function step(){
+  if (i++ < steps){ window.scrollBy(0, 1200); setTimeout(step, 180); return; }
+  window.scrollTo(0, 0);
+  setTimeout(collect, 300);
+})();
+"""
+
+def collect_detail_bundle(browser, gallery_steps=14):
+    """
+    Run DETAIL_BUNDLE_JS (one chromedriver round-trip). Returns {} if the
+    async script is unavailable so the caller can use the per-field helpers.
+    """
+    try:
+        res = browser.driver.execute_async_script(DETAIL_BUNDLE_JS, gallery_steps)
+        b = json.loads(res) if isinstance(res, str) else res
+    except Exception:
+        return {}
+    if not isinstance(b, dict):
+        return {}
+    try:
+        st = hydrated_state(b.get("stateSrc"), fast_json_loads(b.get("state") or "null"))
+    except Exception:
+        st = {}
+    b["state"] = st
+    return b
+
+def detail_bundle_slow(browser):
+    """Per-field fallback producing the same shape as collect_detail_bundle()."""
+    trigger_lazy_gallery(browser)
+    features, reports = dom_collect_options_and_report(browser)
+    texts = []
+    for js in ("document.body?document.body.innerText:''",
+               "document.querySelector('meta[name=\"description\"]')?.content||''",
+               BODYTYPE_CHIPS_JS):
+        try: texts.append(browser.evaluate_script(js) or "")
+        except Exception: texts.append("")
+    return {
+        "url": safe_current_url(browser),
+        "state": get_full_state(browser),
+        "specs": dom_fallback_specs(browser),
+        "bodyText": texts[0], "meta": texts[1], "chips": texts[2],
+        "images": dom_collect_all_imgs(browser),
+        "features": features, "reports": reports,
+    }
+
+def scrape_detail_raw(browser):
+    wait_ready(browser, timeout=12); ensure_english(browser, 4)
+    has_state = wait_for_state(browser, 6)
+    bundle = collect_detail_bundle(browser) or detail_bundle_slow(browser)
+    st = bundle.get("state") or {}
+    if not st and has_state:
+        st = get_full_state(browser)
+    if not st:
+        # No hydration state: the detail app's own API responses carry the same fields,
+        # as long as they belong to this visit and this car
+        xhr = take_xhr_json(browser, XHR_DETAIL_URL_RE, since=xhr_scope_since(browser, "detail"),
+                            key=carid_from_url(safe_current_url(browser)))
+        st = {"xhr": xhr} if xhr else {}
+    st = StateIndex(st)
+
+    sf = state_detail_fields(st)
+    manufacturer, model, grade = sf["manufacturer"], sf["model"], sf["grade"]
+    form_year, year_month      = sf["form_year"], sf["year_month"]
+    ad_price, mileage, fuel    = sf["ad_price"], sf["mileage"], sf["fuel"]
+    color, transmission        = sf["color"], sf["transmission"]
+    body_type, seats           = sf["body_type"], sf["seats"]
+    vin, engine_cc             = sf["vin"], sf["engine_cc"]
+
+    specs = bundle.get("specs") or {}
+    if not isinstance(specs, dict): specs = {}
+    body_txt = bundle.get("bodyText") or ""
+    meta_txt = bundle.get("meta") or ""
+    seats_free = scan_seats_text(body_txt) or scan_seats_text(meta_txt) or ""
 
     manufacturer = manufacturer or specs.get("manufacturer")
     model        = model or specs.get("model")
@@ -1699,36 +2758,27 @@ def scrape_detail_raw(browser):
     fuel         = fuel or specs.get("fuel")
     color        = color or specs.get("color")
     transmission = transmission or specs.get("transmission")
-    seats = seats or specs.get("seats") or seats_free or guess_seats_from_page(browser) or 0
+    seats = seats or specs.get("seats") or seats_free or guess_seats_from_text(body_txt) or 0
     vin          = vin or specs.get("vin")
     engine_cc    = engine_cc or specs.get("engine_cc")
     price_text   = specs.get("price_text", "")
-    body_type    = body_type or specs.get("body_type") or extract_bodytype_freeform(browser)
-
-    features_dom, report_dom = dom_collect_options_and_report(browser)
-    report_state = deep_collect_report_links_from_state(st)
-    report_click = try_click_and_grab_report(browser)
-
-    carid = _extract_carid_from_state_or_url(st, safe_current_url(browser))
-    raw_links = dedup(
-        ([_build_report_url_from_carid(carid)] if carid else [])
-        + report_dom
-        + report_state
-        + ([report_click] if report_click else [])
-    )
-
-    canon_links = []
-    for u in raw_links:
-        c = canonicalize_report_url(u, carid)
-        if c:
-            canon_links.append(c)
-
-    if not canon_links and carid:
-        canon_links = [_build_report_url_from_carid(carid)]
-
-    report_links = dedup(canon_links)
-    images = build_all_images(browser, st, want_count=20)
-
+    body_type    = body_type or specs.get("body_type") or next(
+        (bt for bt in (guess_bodytype_from_text(t) for t in (body_txt, meta_txt, bundle.get("chips") or "")) if bt), "")
+
+    features_dom = dedup(bundle.get("features") or [])
+    carid = _extract_carid_from_state_or_url(st, bundle.get("url") or safe_current_url(browser))
+    if carid:
+        # Every link canonicalises to REPORT_CANON_BASE + carid anyway
+        report_links = [u for u in [resolve_report_url(carid)] if u]
+    else:
+        report_dom   = dedup(bundle.get("reports") or [])
+        report_state = deep_collect_report_links_from_state(st)
+        report_click = try_click_and_grab_report(browser)
+        raw_links = dedup(report_dom + report_state + ([report_click] if report_click else []))
+        report_links = dedup([c for c in (canonicalize_report_url(u) for u in raw_links) if c])
+    images = merge_image_sources(deep_collect_carpicture_paths(st), bundle.get("images") or [], 20)
+
+    report_network_stats(browser, f"detail {carid or '?'}")
     return {
         "manufacturer": manufacturer, "model": model, "grade": grade,
         "form_year": form_year, "year_month": year_month,
@@ -1742,6 +2792,254 @@ def scrape_detail_raw(browser):
         "carid": carid,
     }
 
+# ------------- DETAIL PAGE: browser-free HTTP fast path -------------
+_HTTP_POOL = None
+_HTTP_POOL_LOCK = threading.Lock()
+
+def http_pool():
+    """
+    One process-wide urllib3 pool (urllib3 ships with selenium), so detail
+    pages reuse keep-alive connections instead of paying TCP/TLS per car.
+    """
+    global _HTTP_POOL
+    with _HTTP_POOL_LOCK:
+        if _HTTP_POOL is None:
+            import urllib3
+            _HTTP_POOL = urllib3.PoolManager(
+                num_pools=8,
+                maxsize=HTTP_POOL_SIZE,
+                block=False,
+                headers={
+                    "User-Agent": USER_AGENT,
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+                },
+                retries=urllib3.Retry(total=2, backoff_factor=0.4, status_forcelist=(429, 500, 502, 503, 504)),
+                timeout=urllib3.Timeout(connect=5.0, read=HTTP_TIMEOUT),
+            )
+        return _HTTP_POOL
+
+def fetch_html(url: str) -> str:
+    if not url: return ""
+    try:
+        r = http_pool().request("GET", url, redirect=True)
+    except Exception:
+        return ""
+    if r.status != 200:
+        return ""
+    ctype = r.headers.get("Content-Type", "") or ""
+    m = re.search(r'charset=([\w\-]+)', ctype, re.I)
+    try:
+        return r.data.decode(m.group(1) if m else "utf-8", "replace")
+    except LookupError:
+        return r.data.decode("utf-8", "replace")
+
+def extract_preloaded_state_from_html(html: str, name: str = "__PRELOADED_STATE__"):
+    """
+    Pull `window.__PRELOADED_STATE__ = {...}` (or another global `name`) out
+    of raw HTML. raw_decode stops at the end of the object, so braces inside
+    strings and trailing `;</script>` are never an issue. Also handles
+    JSON.parse("...").
+    """
+    if not html or name not in html:
+        return {}
+    dec = json.JSONDecoder()
+    for m in re.finditer(re.escape(name) + r'\s*=\s*', html):
+        pos = m.end()
+        end = html.find("</script>", pos)
+        if msgspec is not None and end > pos and html.startswith("{", pos):
+            # Usual layout `= {...};</script>`: hand the exact slice to msgspec
+            try:
+                obj = msgspec.json.decode(html[pos:end].rstrip().rstrip(";"))
+                if isinstance(obj, dict) and obj:
+                    return obj
+            except Exception:
+                pass
+        try:
+            if html.startswith("JSON.parse(", pos):
+                inner, _ = dec.raw_decode(html, pos + len("JSON.parse("))
+                obj = json.loads(inner) if isinstance(inner, str) else None
+            else:
+                obj, _ = dec.raw_decode(html, pos)
+        except ValueError:
+            continue
+        if isinstance(obj, dict) and obj:
+            return obj
+    return {}
+
+SCRIPT_JSON_RE = re.compile(r'<script\b([^>]*)>(.*?)</script>', re.I | re.S)
+
+def extract_script_json_from_html(html: str, script_id: str = ""):
+    """
+    JSON hydration in a <script type="application/json"> tag: the one with
+    id=`script_id` (Next.js `__NEXT_DATA__`), or without an id the largest
+    inline JSON script on the page (ld+json metadata is skipped).
+    """
+    if not html or "<script" not in html:
+        return {}
+    best = ""
+    for m in SCRIPT_JSON_RE.finditer(html):
+        attrs, body = m.group(1), m.group(2).strip()
+        if script_id:
+            if re.search(r'\bid=["\']%s["\']' % re.escape(script_id), attrs):
+                best = body
+                break
+        elif re.search(r'type=["\'][^"\']*json', attrs, re.I) and "ld+json" not in attrs.lower() and len(body) > len(best):
+            best = body
+    if not best:
+        return {}
+    try:
+        obj = fast_json_loads(best)
+    except Exception:
+        return {}
+    return obj if isinstance(obj, (dict, list)) and obj else {}
+
+# (source, extractor) pairs tried in order by extract_state_from_html(); append
+# here to support another hydration format on the HTTP path
+HTML_STATE_EXTRACTORS = [(g, (lambda html, g=g: extract_preloaded_state_from_html(html, g))) for g in HYDRATION_GLOBALS]
+HTML_STATE_EXTRACTORS[1:1] = [(g, (lambda html, g=g: extract_script_json_from_html(html, g))) for g in HYDRATION_GLOBALS]
+HTML_STATE_EXTRACTORS.append(("inline-json", extract_script_json_from_html))
+
+def extract_state_from_html(html: str):
+    """First hydration payload found in raw HTML, normalised like get_full_state()."""
+    for src, fn in HTML_STATE_EXTRACTORS:
+        try:
+            st = fn(html)
+        except Exception:
+            st = None
+        if st:
+            return hydrated_state(src, st)
+    return {}
+
+def html_to_text(html: str) -> str:
+    if not html: return ""
+    t = re.sub(r'<(script|style|noscript)\b[^>]*>.*?</\1>', ' ', html, flags=re.I | re.S)
+    t = re.sub(r'<[^>]+>', ' ', t)
+    t = t.replace("&nbsp;", " ").replace("&amp;", "&")
+    return re.sub(r'\s+', ' ', t).strip()
+
+def html_meta_description(html: str) -> str:
+    m = re.search(r'<meta[^>]+name=["\']description["\'][^>]*content=["\']([^"\']*)', html or "", re.I)
+    return m.group(1) if m else ""
+
+OPTION_KEY_RE = re.compile(r'option', re.I)
+
+def state_option_names(obj):
+    """
+    Human-readable option names from state (lists of strings or {name: ...}
+    dicts under *option* keys). Numeric option codes are ignored.
+    """
+    out = []
+    if isinstance(obj, StateIndex):
+        for v in obj.option_lists:
+            for it in v:
+                name = it
+                if isinstance(it, dict):
+                    name = it.get("optionName") or it.get("name") or it.get("title") or ""
+                if isinstance(name, str):
+                    name = name.strip()
+                    if 2 <= len(name) <= 50 and not re.fullmatch(r'[\d\s]+', name):
+                        out.append(name)
+        return dedup(out)
+    q = deque([obj]); seen = set()
+    while q:
+        cur = q.popleft()
+        if id(cur) in seen: continue
+        seen.add(id(cur))
+        if isinstance(cur, dict):
+            for k, v in cur.items():
+                if isinstance(k, str) and OPTION_KEY_RE.search(k) and isinstance(v, list):
+                    for it in v:
+                        name = it
+                        if isinstance(it, dict):
+                            name = it.get("optionName") or it.get("name") or it.get("title") or ""
+                        if isinstance(name, str):
+                            name = name.strip()
+                            if 2 <= len(name) <= 50 and not re.fullmatch(r'[\d\s]+', name):
+                                out.append(name)
+                if isinstance(v, (dict, list)): q.append(v)
+        elif isinstance(cur, list):
+            for v in cur:
+                if isinstance(v, (dict, list)): q.append(v)
+    return dedup(out)
+
+def scrape_detail_raw_http(url: str):
+    """
+    Same dict as scrape_detail_raw(), built from a plain GET of the detail page.
+    Returns None when the HTML carries no usable hydration state so the
+    caller falls back to the Selenium path.
+    """
+    html = fetch_html(url)
+    st = extract_state_from_html(html)
+    if not st:
+        return None
+    st = StateIndex(st)
+
+    sf = state_detail_fields(st)
+    if not (sf["manufacturer"] or sf["model"]):
+        # Shell/bot-wall state without a car in it
+        return None
+
+    text = html_to_text(html)
+    meta = html_meta_description(html)
+    seats = sf["seats"] or scan_seats_text(text) or scan_seats_text(meta) or guess_seats_from_text(text) or 0
+    body_type = sf["body_type"] or guess_bodytype_from_text(meta) or guess_bodytype_from_text(text)
+
+    carid = _extract_carid_from_state_or_url(st, url) or carid_from_url(url)
+    if carid:
+        canon_links = [u for u in [resolve_report_url(carid)] if u]
+    else:
+        report_html = [u for u in re.findall(r'https?://[^\s"\'<>]+', html) if REPORT_URL_RE.search(u)]
+        raw_links = dedup(deep_collect_report_links_from_state(st) + report_html)
+        canon_links = dedup([c for c in (canonicalize_report_url(u) for u in raw_links) if c])
+
+    img_html = re.findall(r'[^\s"\'<>()]*carpicture[^\s"\'<>()]*', html)
+    images = upgrade_list(normalize_img_urls(deep_collect_carpicture_paths(st) + img_html), 1080, True)[:20]
+
+    raw = dict(sf)
+    raw.update({
+        "seats": seats,
+        "body_type": body_type,
+        "price_text": "",
+        "images": images,
+        "features": state_option_names(st),
+        "report_links": dedup(canon_links),
+        "carid": carid,
+    })
+    return raw
+
+# Speculative fetch of the next row's detail page while the current row is written
+_PREFETCH = {}
+_PREFETCH_EXEC = None
+_PREFETCH_LOCK = threading.Lock()
+
+def prefetch_detail_http(url):
+    """Start scrape_detail_raw_http(url) on a background thread (no-op if already started)."""
+    global _PREFETCH_EXEC
+    if not url:
+        return
+    with _PREFETCH_LOCK:
+        if url in _PREFETCH:
+            return
+        if _PREFETCH_EXEC is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _PREFETCH_EXEC = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch")
+        _PREFETCH[url] = _PREFETCH_EXEC.submit(scrape_detail_raw_http, url)
+
+def take_prefetched_http(url):
+    """(hit, raw): the prefetched result for `url`, waiting for it if still in flight."""
+    with _PREFETCH_LOCK:
+        fut = _PREFETCH.pop(url, None)
+        # Anything else queued was for rows we skipped
+        for u in list(_PREFETCH):
+            _PREFETCH.pop(u).cancel()
+    if fut is None:
+        return False, None
+    try:
+        return True, fut.result()
+    except Exception:
+        return True, None
+
 # ------------- Merge -> Albanian schema (no 'lloji') -------------
 def to_albanian_schema(raw, detail_url, list_hint):
     viti = ""
@@ -1769,9 +3067,9 @@ def to_albanian_schema(raw, detail_url, list_hint):
     karb_al  = FUEL_MAP.get(karb.lower(), karb or "")
     trans_al = TRANS_MAP.get(trans.lower(), trans or "")
 
-    prodhuesi = list_hint.get("prodhuesi") or (raw.get("manufacturer") or "")
-    modeli    = list_hint.get("modeli")    or (raw.get("model") or "")
-    varianti  = list_hint.get("varianti")  or (raw.get("grade") or "")
+    prodhuesi = brand_to_latin(prefer_latin(list_hint.get("prodhuesi"), raw.get("manufacturer")))
+    modeli    = prefer_latin(list_hint.get("modeli"), raw.get("model"))
+    varianti  = prefer_latin(list_hint.get("varianti"), raw.get("grade"))
 
     cm_eur = list_hint.get("cmimi_eur")
     if not cm_eur:
@@ -1823,6 +3121,316 @@ def to_albanian_schema(raw, detail_url, list_hint):
         "raporti_url":     raporte,
     }
 
+CSV_FIELDS = [
+    "prodhuesi","modeli","varianti","viti",
+    "cmimi_eur","kilometrazhi_km","karburanti","ngjyra",
+    "transmisioni","uleset","vin","engine_cc","images","listing_url",
+    "opsionet","raporti_url"
+]
+
+def csv_row_from_albanian(alb):
+    row_out = {
+        "prodhuesi": alb["prodhuesi"],
+        "modeli": alb["modeli"],
+        "varianti": alb["varianti"],
+        "viti": alb["viti"],
+        "cmimi_eur": alb["cmimi_eur"],
+        "kilometrazhi_km": alb["kilometrazhi_km"],
+        "karburanti": alb["karburanti"],
+        "ngjyra": alb["ngjyra"],
+        "transmisioni": alb["transmisioni"],
+        "uleset": "" if alb["uleset"] is None else str(alb["uleset"]),
+        "vin": alb["vin"],
+        "engine_cc": alb["engine_cc"],
+        "images": ";".join(alb.get("images", [])),
+        "listing_url": alb["listing_url"],
+        "opsionet": alb["opsionet"],
+        "raporti_url": alb["raporti_url"],
+    }
+    return fill_blanks_in_row(row_out)
+
+_DB_WRITER = None
+_DB_WRITER_LOCK = threading.Lock()
+
+def db_writer():
+    """Process-wide VehicleWriter, created on first use and flushed at exit."""
+    global _DB_WRITER
+    if _DB_WRITER is None:
+        with _DB_WRITER_LOCK:
+            if _DB_WRITER is None:
+                import atexit
+                _DB_WRITER = VehicleWriter()
+                atexit.register(_DB_WRITER.close)
+    return _DB_WRITER
+
+def upsert_if_enabled(row_out):
+    if not WRITE_DB:
+        return
+    missing = [v for v in ("DB_HOST","DB_PORT","DB_USERNAME","DB_PASSWORD","DB_DATABASE") if not os.getenv(v)]
+    if missing:
+        print(f"[skip-db] missing {', '.join(missing)}; skipping DB upsert")
+    else:
+        db_writer().add(row_out)
+
+def write_debug_html(browser):
+    try:
+        debug_dir = os.path.join(APP_ROOT, "scripts")
+        os.makedirs(debug_dir, exist_ok=True)
+        with open(os.path.join(debug_dir, "debug.html"), "w", encoding="utf-8") as fdbg:
+            fdbg.write(browser.html or "")
+    except Exception as _e:
+        print(f"[debug-skip] could not write debug.html: {_e}")
+
+# ---------------- Seen-listing store (SQLite) ----------------
+_SEEN = None
+_SEEN_LOCK = threading.Lock()
+
+def seen_db():
+    """Lazily open SEEN_DB (shared by worker threads, serialised by _SEEN_LOCK)."""
+    global _SEEN
+    if _SEEN is None and SEEN_DB:
+        try:
+            mkdirs(os.path.dirname(os.path.abspath(SEEN_DB)))
+            conn = sqlite3.connect(SEEN_DB, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen (
+                    carid       TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    first_seen  REAL NOT NULL,
+                    scraped_at  REAL NOT NULL,
+                    updated_at  REAL NOT NULL
+                )""")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            _SEEN = conn
+        except Exception as e:
+            print(f"[seen] disabled, cannot open {SEEN_DB}: {e}")
+            return None
+    return _SEEN
+
+def list_fingerprint(title, eur_list, href) -> str:
+    blob = "\x1f".join([re.sub(r"\s+", " ", str(title or "")).strip(), str(eur_list or 0), str(href or "").strip()])
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+def seen_unchanged(carid, fingerprint) -> bool:
+    """
+    True when `carid` was scraped before with the same list fingerprint; its
+    updated_at is bumped so the store shows it is still listed.
+    """
+    db = seen_db()
+    if not db or not carid:
+        return False
+    now = time.time()
+    with _SEEN_LOCK:
+        try:
+            r = db.execute("SELECT fingerprint, scraped_at FROM seen WHERE carid=?", (str(carid),)).fetchone()
+            if not r or r[0] != fingerprint:
+                return False
+            if SEEN_MAX_AGE_H > 0 and now - r[1] > SEEN_MAX_AGE_H * 3600:
+                return False
+            db.execute("UPDATE seen SET updated_at=? WHERE carid=?", (now, str(carid)))
+            return True
+        except Exception as e:
+            print(f"[seen] lookup failed for {carid}: {e}")
+            return False
+
+def seen_record(carid, fingerprint):
+    db = seen_db()
+    if not db or not carid:
+        return
+    now = time.time()
+    with _SEEN_LOCK:
+        try:
+            db.execute(
+                "INSERT INTO seen (carid, fingerprint, first_seen, scraped_at, updated_at) VALUES (?,?,?,?,?) "
+                "ON CONFLICT(carid) DO UPDATE SET fingerprint=excluded.fingerprint, "
+                "scraped_at=excluded.scraped_at, updated_at=excluded.updated_at",
+                (str(carid), fingerprint, now, now, now),
+            )
+        except Exception as e:
+            print(f"[seen] record failed for {carid}: {e}")
+
+# ---------------- ModifiedDate watermark ----------------
+def modified_key(v) -> str:
+    """ModifiedDate (date string or epoch s/ms) -> sortable 'YYYYMMDDhhmmss', '' if unknown."""
+    if v is None or v == "":
+        return ""
+    if isinstance(v, (int, float)) or re.fullmatch(r'1\d{9}(\d{3})?', str(v).strip()):
+        x = float(v)
+        x = x / 1000 if x > 1e11 else x
+        return time.strftime("%Y%m%d%H%M%S", time.gmtime(x))
+    d = re.sub(r'\D', '', str(v))
+    return d[:14].ljust(14, "0") if len(d) >= 8 else ""
+
+def watermark_load():
+    """(modified, carid) of the newest listing a previous complete run got through, or None."""
+    db = seen_db()
+    if not db:
+        return None
+    with _SEEN_LOCK:
+        try:
+            r = db.execute("SELECT value FROM meta WHERE key='watermark'").fetchone()
+            mark = json.loads(r[0]) if r else None
+            return (str(mark[0]), str(mark[1])) if mark and mark[0] else None
+        except Exception as e:
+            print(f"[watermark] load failed: {e}")
+            return None
+
+def watermark_save(mark):
+    db = seen_db()
+    if not db or not mark:
+        return
+    with _SEEN_LOCK:
+        try:
+            db.execute("INSERT INTO meta (key, value) VALUES ('watermark', ?) "
+                       "ON CONFLICT(key) DO UPDATE SET value=excluded.value", (json.dumps(list(mark)),))
+            print(f"[watermark] saved {mark[0]} (carid {mark[1]})")
+        except Exception as e:
+            print(f"[watermark] save failed: {e}")
+
+def page_marks(recs):
+    return [(r["modified"], str(r.get("carid") or "")) for r in recs if r.get("modified")]
+
+def page_below_watermark(recs, mark) -> bool:
+    """True when every dated record on the page is at or below `mark`."""
+    marks = page_marks(recs)
+    return bool(mark and marks) and all(m <= tuple(mark) for m in marks)
+
+# ---------------- Checkpoint / resume ----------------
+def checkpoint_load():
+    try:
+        with open(CHECKPOINT_PATH, "r", encoding="utf-8") as fh:
+            ck = json.load(fh)
+        return ck if isinstance(ck, dict) else None
+    except Exception:
+        return None
+
+def checkpoint_save(f, page, row_index, done_carids, total_done):
+    """
+    Flush the CSV and atomically replace the journal: list position, carids
+    already written and the CSV byte offset those rows end at.
+    """
+    try:
+        f.flush()
+        ck = {
+            "csv_path": os.path.abspath(f.name),
+            "csv_offset": f.buffer.tell(),
+            "page": int(page or 1),
+            "limit": list_page_size(),
+            "row_index": int(row_index or 0),
+            "total_done": int(total_done or 0),
+            "done": sorted(done_carids),
+            "ts": time.time(),
+        }
+        tmp = CHECKPOINT_PATH + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(ck, fh)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, CHECKPOINT_PATH)
+    except Exception as e:
+        print(f"[checkpoint] write failed: {e}")
+
+def checkpoint_clear():
+    try:
+        os.remove(CHECKPOINT_PATH)
+    except Exception:
+        pass
+
+def open_run_csv(csv_path, resume=False):
+    """
+    Returns (file, checkpoint). A fresh run truncates the CSV and writes the header;
+    with `resume` the CSV is cut back to the checkpointed offset (dropping any
+    half-written row) and reopened for append.
+    """
+    ck = checkpoint_load() if resume else None
+    if ck and ck.get("csv_path") == os.path.abspath(csv_path) and os.path.exists(csv_path):
+        off = int(ck.get("csv_offset") or 0)
+        if 0 < off <= os.path.getsize(csv_path):
+            with open(csv_path, "r+b") as fb:
+                fb.truncate(off)
+            print(f"[resume] page {ck.get('page')}, row {ck.get('row_index')}, "
+                  f"{len(ck.get('done') or [])} rows already in {csv_path}")
+            return open(csv_path, "a", newline="", encoding="utf-8-sig"), ck
+    if resume:
+        print("[resume] no usable checkpoint; starting from page 1")
+    f = open(csv_path, "w", newline="", encoding="utf-8-sig")
+    csv.DictWriter(f, fieldnames=CSV_FIELDS).writeheader()
+    f.flush()
+    return f, None
+
+# ---------------- Background row writer ----------------
+class RowSink:
+    """
+    Bounded queue drained by one writer thread that owns every output side effect
+    of a scraped row: CSV line, WRITE_DB upsert, seen-store record and checkpoint.
+    The scraping loop only enqueues, so a slow disk or DB never stalls the browser
+    (until ROW_QUEUE_SIZE rows are backed up). Use as a context manager: a clean
+    exit drains the queue, flushes the DB writer and removes the checkpoint.
+    """
+    def __init__(self, csv_file, ck=None, maxsize=None):
+        import queue
+        self.f = csv_file
+        self.writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS)
+        self.q = queue.Queue(maxsize=maxsize or ROW_QUEUE_SIZE)
+        self.done_carids = set((ck or {}).get("done") or [])
+        self.written = int((ck or {}).get("total_done") or 0)
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.max_depth = 0
+        self.thread = threading.Thread(target=self._run, name="row-writer", daemon=True)
+        self.thread.start()
+
+    def put(self, row_out, carid="", fingerprint="", page=1, row_index=0):
+        self.q.put((time.time(), row_out, carid, fingerprint, page, row_index))
+        self.max_depth = max(self.max_depth, self.q.qsize())
+
+    def metrics(self):
+        return {"depth": self.q.qsize(), "max_depth": self.max_depth, "written": self.written,
+                "lag_s": round(self.last_lag, 3), "max_lag_s": round(self.max_lag, 3)}
+
+    def _run(self):
+        while True:
+            item = self.q.get()
+            try:
+                if item is None:
+                    return
+                t_put, row_out, carid, fingerprint, page, row_index = item
+                try:
+                    upsert_if_enabled(row_out)
+                    self.writer.writerow(row_out)
+                    seen_record(carid, fingerprint)
+                    self.written += 1
+                    if carid:
+                        self.done_carids.add(carid)
+                    checkpoint_save(self.f, page, row_index, self.done_carids, self.written)
+                except Exception as e:
+                    print(f"[sink] write failed for {carid or '?'}: {e}")
+                self.last_lag = time.time() - t_put
+                self.max_lag = max(self.max_lag, self.last_lag)
+                if self.written % 25 == 0:
+                    m = self.metrics()
+                    print(f"[sink] written={m['written']} depth={m['depth']} lag={m['lag_s']}s max_lag={m['max_lag_s']}s")
+            finally:
+                self.q.task_done()
+
+    def close(self, clean=True):
+        self.q.put(None)
+        self.thread.join()
+        if _DB_WRITER is not None:
+            _DB_WRITER.flush()
+        m = self.metrics()
+        print(f"[sink] drained: {m['written']} rows, max depth {m['max_depth']}, max lag {m['max_lag_s']}s")
+        if clean:
+            checkpoint_clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(clean=exc_type is None)
+        return False
+
 # ---------------- List helpers (thumb + url) ----------------
 def extract_listing_thumb(row):
     def pick_src(img):
@@ -1985,12 +3593,140 @@ def click_detail_and_get_url(browser, row, retries=3, force_new_tab=True):
     return absolutize(href_seen or "")
 
 def switch_to_new_tab(browser, prev_count, timeout=8):
-    t0=time.time()
-    while time.time()-t0<timeout:
-        if len(browser.windows)>prev_count:
-            browser.windows[-1].is_current=True; return True
-        time.sleep(0.2)
-    return False
+    # Window handles are not observable from page JS; WebDriverWait with a tight
+    # poll returns on the first check after the handle appears.
+    try:
+        WebDriverWait(browser.driver, timeout, poll_frequency=0.05).until(
+            lambda d: len(d.window_handles) > prev_count
+        )
+    except Exception:
+        return False
+    browser.windows[-1].is_current = True
+    apply_network_profile(browser)
+    return True
+
+class DetailTabPool:
+    """
+    A few long-lived detail tabs that are re-navigated from car to car instead of
+    opening, polling for and closing a tab per listing. scrape(url) round-robins
+    over the tabs, returns scrape_detail_raw's dict (None if the visit failed)
+    and always switches back to the list tab. Per-tab latency is kept for stats().
+    """
+    def __init__(self, browser, size=None):
+        self.browser = browser
+        self.size = max(1, size or DETAIL_TABS)
+        self.home = browser.driver.current_window_handle
+        self.tabs = []
+        self.turn = 0
+        self.pending = {}   # tab handle -> url it was told to load ahead of time
+        self.started = {}   # tab handle -> when that load began
+        self.timings = defaultdict(list)
+
+    def _tab(self):
+        d = self.browser.driver
+        if len(self.tabs) < self.size:
+            d.switch_to.new_window("tab")
+            apply_network_profile(self.browser)
+            self.tabs.append(d.current_window_handle)
+            return self.tabs[-1]
+        h = self.tabs[self.turn % len(self.tabs)]
+        self.turn += 1
+        d.switch_to.window(h)
+        return h
+
+    def prefetch(self, url):
+        """
+        Start loading `url` in the next tab without waiting for it; a later
+        scrape(url) finds the page (nearly) hydrated and skips the visit.
+        """
+        if not url or url in self.pending.values():
+            return False
+        d = self.browser.driver
+        try:
+            h = self._tab()
+            d.execute_script("window.location.href = arguments[0];", url)
+            self.pending[h] = url
+            self.started[h] = time.time()
+            return True
+        except Exception:
+            return False
+        finally:
+            try:
+                d.switch_to.window(self.home)
+            except Exception:
+                pass
+
+    def _discard(self, h):
+        try:
+            self.browser.driver.switch_to.window(h)
+            self.browser.driver.close()
+        except Exception:
+            pass
+        if h in self.tabs:
+            self.tabs.remove(h)
+        self.pending.pop(h, None)
+        self.started.pop(h, None)
+
+    def scrape(self, url):
+        d = self.browser.driver
+        t0 = time.time()
+        h = next((t for t, u in self.pending.items() if u == url), None)
+        try:
+            if h:
+                d.switch_to.window(h)
+            else:
+                h = self._tab()
+        except Exception as e:
+            print(f"[tabs] cannot open a detail tab: {e}")
+            return None
+        ahead = self.pending.pop(h, None) == url
+        started = self.started.pop(h, 0.0)
+        raw = None
+        try:
+            if ahead:
+                wait_ready(self.browser, 15)
+                install_stealth_patches(self.browser)
+                if hit_bot_wall(self.browser):
+                    ahead = False
+            if ahead:
+                # Its detail XHRs arrived from the prefetch on; the carid filter does the rest
+                set_xhr_scope(self.browser, "detail", started)
+            else:
+                mark_xhr_scope(self.browser, "detail", XHR_DETAIL_URL_RE)
+            if ahead or visit_safely(self.browser, url):
+                raw = scrape_detail_raw(self.browser)
+            else:
+                debug_dump(self.browser, "tab_visit_fail")
+        except Exception as e:
+            # Renderer crashed or the tab went away: a fresh one is opened next time
+            print(f"[tabs] {url}: {e}")
+            self._discard(h)
+        finally:
+            try:
+                d.switch_to.window(self.home)
+            except Exception:
+                pass
+        self.timings[h].append(time.time() - t0)
+        return raw
+
+    def stats(self):
+        out = []
+        for i, (h, ts) in enumerate(self.timings.items(), 1):
+            ts = sorted(ts)
+            out.append({"tab": i, "cars": len(ts), "avg_s": round(sum(ts) / len(ts), 2),
+                        "p50_s": round(ts[len(ts) // 2], 2), "max_s": round(ts[-1], 2)})
+        return out
+
+    def close(self):
+        for st in self.stats():
+            print(f"[tabs] tab {st['tab']}: {st['cars']} cars, avg {st['avg_s']}s, "
+                  f"p50 {st['p50_s']}s, max {st['max_s']}s")
+        for h in list(self.tabs):
+            self._discard(h)
+        try:
+            self.browser.driver.switch_to.window(self.home)
+        except Exception:
+            pass
 
 def _join_blob(parts):
     return " ".join(str(p) for p in parts if p).strip().lower()
@@ -2018,44 +3754,63 @@ def _normalize_color(text, features_blob=""):
     return "Other"
 
 # ---------------- Paging ----------------
-def go_to_page(browser, page_no, timeout=10):
+_LIST_LIMIT = None   # rows per list page, settled by probe_page_size
+
+def list_page_size() -> int:
+    return _LIST_LIMIT or PER_PAGE
+
+def set_list_page_size(n) -> int:
+    global _LIST_LIMIT
+    _LIST_LIMIT = int(n or PER_PAGE)
+    return _LIST_LIMIT
+
+def go_to_page(browser, page_no, timeout=10, limit=None):
+    limit = int(limit or list_page_size())
+    try:
+        prev_sig = browser.evaluate_script(LIST_SIGNATURE_JS) or ""
+    except Exception:
+        prev_sig = ""
+
     def wait_rows():
-        t0 = time.time()
-        while time.time()-t0 < timeout:
-            try:
-                if len(find_list_rows(browser)) > 0 or any_detail_links(browser):
-                    return True
-            except:
-                pass
-            time.sleep(0.2)
-        return False
+        # Resolve once the re-rendered rows differ from the page we left;
+        # if nothing changes, fall back to "rows/links are present" at timeout.
+        pred = "(function(s){ return s !== '' && s !== %s; })(%s)" % (json.dumps(prev_sig), LIST_SIGNATURE_JS)
+        if not prev_sig:
+            pred += " || " + ANY_DETAIL_LINKS_JS.strip()
+        if wait_until(browser, pred, timeout):
+            return True
+        try:
+            return len(find_list_rows(browser)) > 0 or any_detail_links(browser)
+        except Exception:
+            return False
 
+    mark_xhr_scope(browser, "list", XHR_LIST_URL_RE)
     try:
-        js = f"""
-        (function(targetPage){{
-          function parseHash(){{
-            try{{
+        js = r"""
+        (function(targetPage){
+          function parseHash(){
+            try{
               var h = location.hash || '';
               var m = h.match(/#!(.*)$/);
               if(!m) return null;
               return JSON.parse(decodeURIComponent(m[1]));
-            }}catch(e){{ return null; }}
-          }}
-          var o = parseHash() || {{}};
+            }catch(e){ return null; }
+          }
+          var o = parseHash() || {};
           o.page = targetPage;
-          if (!o.limit) o.limit = {PER_PAGE};
+          o.limit = %d;
           var next = '#!' + encodeURIComponent(JSON.stringify(o));
-          if (location.hash !== next) {{
+          if (location.hash !== next) {
             location.hash = next;
-          }} else {{
+          } else {
             location.hash = '';
             location.hash = next;
-          }}
-        }})(%d);
-        """ % int(page_no)
+          }
+        })(%d);
+        """ % (limit, int(page_no))
         browser.execute_script(js)
         if wait_rows():
-            force_load_list_rows(browser, want=PER_PAGE)
+            force_load_list_rows(browser, want=limit)
             return True
     except:
         pass
@@ -2078,16 +3833,43 @@ def go_to_page(browser, page_no, timeout=10):
                     try: browser.execute_script("arguments[0].click();", el._element)
                     except: pass
                 if wait_rows():
-                    force_load_list_rows(browser, want=PER_PAGE)
+                    force_load_list_rows(browser, want=limit)
                     return True
     except:
         pass
     return False
 
+def probe_page_size(browser, sizes=None):
+    """
+    Ask page 1 for the larger `limit` values (descending) and keep the first one
+    the site renders in full. Falls back to PER_PAGE, restoring that limit.
+    """
+    tried = False
+    for size in sorted({s for s in (PAGE_SIZES if sizes is None else sizes) if s > PER_PAGE}, reverse=True):
+        tried = True
+        if go_to_page(browser, 1, limit=size):
+            cnt = force_load_list_rows(browser, want=size)
+            if cnt >= size:
+                print(f"[list] page size {size} honoured ({cnt} rows on page 1)")
+                return set_list_page_size(size)
+            print(f"[list] page size {size} not honoured ({cnt} rows)")
+    if tried:
+        go_to_page(browser, 1, limit=PER_PAGE)
+    return set_list_page_size(PER_PAGE)
+
 def get_paging_info(browser):
-    st = get_full_state(browser) if wait_for_state(browser, 2) else {}
     page = 1
     total_pages = None
+    if not wait_for_state(browser, 2):
+        return page, total_pages
+    pr = project_state(browser, names=["page", "pagecount", "totalpages"], ci=True, numeric=True)
+    if pr is not None:
+        got = pr.get("names") or {}
+        if got.get("page") is not None:
+            page = int(got["page"])
+        tp = got.get("pagecount", got.get("totalpages"))
+        return page, (int(tp) if tp is not None else None)
+    st = get_full_state(browser)
     try:
         txt = json.dumps(st).lower()
         m1 = re.search(r'"page"\s*:\s*(\d+)', txt)
@@ -2100,6 +3882,55 @@ def get_paging_info(browser):
         pass
     return page, total_pages
 
+# ---------------- Search-filter shards ----------------
+def parse_year_bands(spec, first_year=2015):
+    """
+    "2015-2016,2017,2018-" -> [(2015, 2016), (2017, 2017), (2018, None)].
+    "auto" gives one band per model year from `first_year`, the last one open.
+    """
+    spec = (spec or "").strip().lower()
+    if not spec:
+        return []
+    if spec == "auto":
+        this_year = time.localtime().tm_year
+        return [(y, y) for y in range(first_year, this_year)] + [(this_year, None)]
+    bands = []
+    for part in spec.split(","):
+        m = re.fullmatch(r'\s*(\d{4})\s*(?:(-)\s*(\d{4})?)?\s*', part)
+        if not m:
+            print(f"[shards] ignoring year band {part!r}")
+            continue
+        lo = int(m.group(1))
+        hi = int(m.group(3)) if m.group(3) else (None if m.group(2) else lo)
+        bands.append((lo, hi))
+    return bands
+
+def shard_search_url(base_url, year_lo, year_hi=None):
+    """
+    Rewrite the `#!{...}` hash of a search URL so its action only covers
+    model years year_lo..year_hi (open-ended when year_hi is None). Encar
+    encodes years as YYYYMM, so a band is Year.range(YYYY00..YYYY99).
+    """
+    head, sep, frag = base_url.partition("#!")
+    try:
+        o = json.loads(unquote(frag)) if sep else {}
+    except Exception:
+        o = {}
+    rng = f"Year.range({year_lo}00..{'%d99' % year_hi if year_hi else ''})"
+    action = o.get("action") or "(And.Hidden.N._.CarType.N.)"
+    if re.search(r'Year\.range\([^)]*\)', action):
+        action = re.sub(r'Year\.range\([^)]*\)', rng, action)
+    else:
+        action = re.sub(r'\)\s*$', f"_.{rng}.)", action)
+    o["action"] = action
+    o["page"] = 1
+    o["limit"] = list_page_size()
+    return head + "#!" + quote(json.dumps(o, ensure_ascii=False, separators=(",", ":")), safe="")
+
+def plan_filter_shards(base_url=BASE_URL, spec=None):
+    """Disjoint search URLs, one per year band; [] when sharding is off."""
+    return [shard_search_url(base_url, lo, hi) for lo, hi in parse_year_bands(YEAR_BANDS if spec is None else spec)]
+
 # ---------------- URL collectors (beefed up) ----------------
 LINK_SEL_JS = r"""
 (function(maxWanted){
@@ -2181,12 +4012,7 @@ def collect_listing_urls_iframes(browser, want_urls=MAX_LISTINGS):
             try: browser.driver.switch_to.default_content()
             except: pass
     return dedup(out)[:want_urls]
-def install_stealth_patches(browser):
-    """
-    Patch common bot fingerprints in-page.
-    Safe to call many times; no external libs required.
-    """
-    js = r"""
+STEALTH_JS = r"""
     (function () {
       try {
         // 1) navigator.webdriver
@@ -2261,8 +4087,14 @@ def install_stealth_patches(browser):
       } catch (e) { try { console.debug('stealth error', e); } catch(_){} }
     })();
     """
+
+def install_stealth_patches(browser):
+    """
+    Patch common bot fingerprints in-page.
+    Safe to call many times; no external libs required.
+    """
     try:
-        browser.execute_script(js)
+        browser.execute_script(STEALTH_JS)
     except Exception:
         pass
 
@@ -2296,6 +4128,222 @@ def set_cdp_fingerprints(browser):
     except Exception:
         pass
 
+# ---------------- Network profile (resource blocking + per-page byte stats) ----------------
+# Rough transfer size of a blocked request, by CDP resource type; only used for the
+# "saved" estimate since blocked requests never report a size.
+BLOCKED_BYTES_ESTIMATE = {
+    "Image": 60_000, "Font": 40_000, "Media": 400_000,
+    "Script": 25_000, "XHR": 2_000, "Fetch": 2_000, "Other": 5_000,
+}
+
+def apply_network_profile(browser):
+    """
+    Enable the CDP Network domain on the current target and install BLOCK_URLS.
+    CDP commands only reach the focused tab, so call again after switching tabs.
+    """
+    d = getattr(browser, "driver", None)
+    if not d or not BLOCK_RESOURCES or not BLOCK_URLS:
+        return False
+    try:
+        d.execute_cdp_cmd("Network.enable", {})
+        d.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCK_URLS})
+        return True
+    except Exception:
+        return False
+
+def _read_perf_log(browser):
+    d = getattr(browser, "driver", None)
+    if not d:
+        return []
+    try:
+        entries = d.get_log("performance") or []
+    except Exception:
+        return []
+    out = []
+    for e in entries:
+        try:
+            msg = json.loads(e.get("message") or "{}").get("message") or {}
+        except Exception:
+            continue
+        if str(msg.get("method", "")).startswith("Network."):
+            out.append(msg)
+    capture_xhr_json(browser, out)
+    return out
+
+def pump_network_events(browser):
+    """
+    Read the performance log now (so XHR bodies are fetched while Chrome still
+    has them) and keep the events for the next drain_network_events.
+    """
+    evs = _read_perf_log(browser)
+    if NET_STATS and evs:
+        try:
+            browser._net_pending = getattr(browser, "_net_pending", []) + evs
+        except Exception:
+            pass
+    return evs
+
+def drain_network_events(browser):
+    """Pop buffered Network.* CDP events from Chrome's performance log."""
+    out = getattr(browser, "_net_pending", None) or []
+    if out:
+        browser._net_pending = []
+    return out + _read_perf_log(browser)
+
+def network_stats(events):
+    types = {}
+    st = {"requests": 0, "bytes": 0, "blocked": 0, "saved": 0}
+    for ev in events or []:
+        m = ev.get("method")
+        p = ev.get("params") or {}
+        if m == "Network.requestWillBeSent":
+            types[p.get("requestId")] = p.get("type") or "Other"
+        elif m == "Network.loadingFinished":
+            st["requests"] += 1
+            st["bytes"] += int(p.get("encodedDataLength") or 0)
+        elif m == "Network.loadingFailed" and p.get("blockedReason"):
+            t = p.get("type") or types.get(p.get("requestId")) or "Other"
+            st["blocked"] += 1
+            st["saved"] += BLOCKED_BYTES_ESTIMATE.get(t, BLOCKED_BYTES_ESTIMATE["Other"])
+    return st
+
+def report_network_stats(browser, label, events=None):
+    """Print one [net] line for everything loaded since the previous call."""
+    if not NET_STATS:
+        return None
+    st = network_stats(drain_network_events(browser) if events is None else events)
+    if st["requests"] or st["blocked"]:
+        print(f"[net] {label}: {st['requests']} req, {st['bytes']/1024:.0f} KB transferred, "
+              f"{st['blocked']} blocked (~{st['saved']/1024:.0f} KB saved)")
+    return st
+
+# ---------------- XHR JSON capture ----------------
+def capture_xhr_json(browser, events):
+    """
+    For JSON responses whose URL matches XHR_URL_RE, pull the body with
+    Network.getResponseBody once loading finished and keep it on the browser
+    (newest XHR_KEEP). Bodies only exist on the tab that made the request.
+    """
+    if not XHR_CAPTURE or not events:
+        return 0
+    d = getattr(browser, "driver", None)
+    if not d:
+        return 0
+    try:
+        want = browser._xhr_want
+    except AttributeError:
+        want = browser._xhr_want = {}
+        browser._xhr_json = deque(maxlen=XHR_KEEP)
+    kept = 0
+    for ev in events:
+        m = ev.get("method")
+        p = ev.get("params") or {}
+        if m == "Network.responseReceived":
+            resp = p.get("response") or {}
+            url = resp.get("url") or ""
+            if "json" in str(resp.get("mimeType") or "").lower() and XHR_URL_RE.search(url):
+                want[p.get("requestId")] = url
+        elif m == "Network.loadingFinished" and p.get("requestId") in want:
+            url = want.pop(p.get("requestId"))
+            try:
+                body = d.execute_cdp_cmd("Network.getResponseBody", {"requestId": p["requestId"]}) or {}
+                text = body.get("body") or ""
+                if body.get("base64Encoded"):
+                    import base64
+                    text = base64.b64decode(text).decode("utf-8", "replace")
+                browser._xhr_json.append({"url": url, "data": normalize_xhr_payload(decode_xhr_body(text)), "ts": time.time()})
+                kept += 1
+            except Exception:
+                pass
+        elif m == "Network.loadingFailed":
+            want.pop(p.get("requestId"), None)
+    return kept
+
+def xhr_url_page(url):
+    """(page, limit) a list request asked for, or None when its URL doesn't say."""
+    u = unquote(url or "")
+    m = re.search(r'[?&]sr=\|[^|&]*\|(\d+)\|(\d+)', u)
+    if m:
+        off, lim = int(m.group(1)), int(m.group(2))
+        return (off // lim + 1 if lim else 1), lim
+    m = re.search(r'[?&]page=(\d+)', u)
+    if m:
+        lm = re.search(r'[?&](?:limit|size)=(\d+)', u)
+        return int(m.group(1)), (int(lm.group(1)) if lm else None)
+    return None
+
+def take_xhr_json(browser, url_re=None, since=0.0, key="", page=None):
+    """
+    Pop the captured JSON payloads (optionally only URLs matching url_re).
+    Everything matching is removed from the buffer, but only payloads captured
+    after `since` are returned; `page` = (page, limit) drops list responses
+    for another page, and `key` (a carid) keeps the payloads that mention it,
+    else just the newest one.
+    """
+    pump_network_events(browser)
+    buf = getattr(browser, "_xhr_json", None)
+    if not buf:
+        return []
+    got = [x for x in buf if not url_re or re.search(url_re, x["url"])]
+    for x in got:
+        buf.remove(x)
+    got = [x for x in got if x["ts"] >= since]
+    if page:
+        def same_page(x):
+            pg = xhr_url_page(x["url"])
+            return pg is None or (pg[0] == page[0] and (not pg[1] or not page[1] or pg[1] == page[1]))
+        got = [x for x in got if same_page(x)]
+    if key and got:
+        got = ([x for x in got if key in x["url"]]
+               or [x for x in got if key in json.dumps(x["data"], default=str)]
+               or got[-1:])
+    return [x["data"] for x in got]
+
+def mark_xhr_scope(browser, scope, url_re=None):
+    """
+    Start a capture scope ("detail" before a detail visit, "list" before a page
+    change): drops payloads still buffered for url_re and records the time that
+    xhr_scope_since() hands to take_xhr_json(since=...).
+    """
+    if not XHR_CAPTURE:
+        return 0.0
+    take_xhr_json(browser, url_re)
+    return set_xhr_scope(browser, scope, time.time())
+
+def set_xhr_scope(browser, scope, ts):
+    try:
+        browser._xhr_scope = dict(getattr(browser, "_xhr_scope", None) or {}, **{scope: ts})
+    except Exception:
+        pass
+    return ts
+
+def xhr_scope_since(browser, scope):
+    return (getattr(browser, "_xhr_scope", None) or {}).get(scope, 0.0)
+
+def normalize_xhr_payload(obj):
+    """
+    Encar's search API items ({"Id", "Manufacturer", "Model", "Badge", "Price"
+    in 만원, ...}) gain the carId/title/priceText/price keys the state
+    collectors look for; everything else passes through untouched.
+    """
+    q = deque([obj])
+    while q:
+        cur = q.popleft()
+        if isinstance(cur, dict):
+            cid = str(cur.get("Id") or "").strip()
+            if re.fullmatch(r'\d{6,}', cid) and ("Manufacturer" in cur or "Price" in cur):
+                cur.setdefault("carId", cid)
+                title = " ".join(str(cur.get(k) or "").strip() for k in ("Manufacturer", "Model", "Badge")).strip()
+                if title:
+                    cur.setdefault("title", re.sub(r"\s+", " ", title))
+                price = cur.get("Price")
+                if isinstance(price, (int, float)) and price > 0:
+                    cur.setdefault("priceText", f"{int(price):,}만원")
+                    cur.setdefault("price", int(price) * 10000)
+            q.extend(v for v in cur.values() if isinstance(v, (dict, list)))
+        elif isinstance(cur, list):
+            q.extend(v for v in cur if isinstance(v, (dict, list)))
+    return obj
 
 def human_pause(a=0.08, b=0.35):
     time.sleep(random.uniform(a, b))
@@ -2427,10 +4475,12 @@ def collect_listing_urls_from_state(browser, want_urls=MAX_LISTINGS):
     return dedup(urls)[:want_urls], by_carid
 
 @contextmanager
-def build_browser():
+def build_browser(profile_dir=None):
     """
     Headful by default (HEADLESS=0). In CI we wrap with xvfb-run.
     Selenium Manager resolves the matching chromedriver automatically.
+    Pass `profile_dir` when several Chromes run side by side: two instances
+    can never share one --user-data-dir.
     """
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.chrome.service import Service
@@ -2456,13 +4506,13 @@ def build_browser():
     opts.add_experimental_option("excludeSwitches", ["enable-automation"])
     opts.add_experimental_option("useAutomationExtension", False)
 
-    # Stable desktop UA (override with UA=...)
-    ua = os.getenv(
-        "UA",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-    )
-    opts.add_argument(f"--user-agent={ua}")
+    opts.add_argument(f"--user-agent={USER_AGENT}")
+
+    # Network.* events in the performance log feed the per-page [net] byte report
+    # and the XHR JSON capture
+    if NET_STATS or XHR_CAPTURE:
+        opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        opts.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
 
     # Use setup-chrome’s path if present
     chrome_bin = (os.environ.get("CHROME_BIN")
@@ -2473,15 +4523,24 @@ def build_browser():
     if chrome_bin:
         opts.binary_location = chrome_bin
 
-    # Auto-translate KR -> EN
-    opts.add_experimental_option("prefs", {
-        "intl.accept_languages": "en-US,en",
-        "translate_whitelists": {"ko": "en"},
-        "translate": {"enabled": True},
-    })
+    if TRANSLATE:
+        # Auto-translate KR -> EN
+        opts.add_experimental_option("prefs", {
+            "intl.accept_languages": "en-US,en",
+            "translate_whitelists": {"ko": "en"},
+            "translate": {"enabled": True},
+        })
+    else:
+        # Bilingual mode: keep the Korean page, never show the translate bar
+        opts.add_argument("--disable-features=Translate")
+        opts.add_experimental_option("prefs", {
+            "intl.accept_languages": "ko-KR,ko,en-US,en",
+            "translate": {"enabled": False},
+        })
 
     # Unique profile/cache per run (or reuse provided one)
-    profile_dir = os.getenv("CHROME_USER_DATA_DIR") or tempfile.mkdtemp(prefix="encar-chrome-")
+    profile_dir = profile_dir or os.getenv("CHROME_USER_DATA_DIR") or tempfile.mkdtemp(prefix="encar-chrome-")
+    os.makedirs(profile_dir, exist_ok=True)
     cache_dir   = tempfile.mkdtemp(prefix="encar-cache-")
     opts.add_argument(f"--user-data-dir={profile_dir}")
     opts.add_argument("--profile-directory=Default")
@@ -2499,6 +4558,12 @@ def build_browser():
         except Exception:
             pass
 
+        # Drop images/fonts/media/trackers before the first navigation
+        apply_network_profile(br)
+
+        # Capture list rows from document start, before the app mounts any
+        install_row_capture(br)
+
         # Baseline stealth: hide webdriver flag (kept for redundancy)
         try:
             br.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined});")
@@ -2522,8 +4587,307 @@ def build_browser():
         except Exception:
             pass
 
-def main():
+# ---------------- Parallel detail workers (--workers N) ----------------
+def list_hint_from_record(rec):
+    title = (rec.get("title") or "").strip()
+    brand, model, variant = parse_title_brand_model_variant(title)
+    _krw, eur_list = parse_list_price_eur((rec.get("priceText") or "").strip(), rec.get("priceNum", None), rec.get("row_html") or "")
+    return {
+        "prodhuesi": brand,
+        "modeli": model,
+        "varianti": variant,
+        "cmimi_eur": eur_list,
+        "engine_cc_hint": 0,
+        "color_hint": "",
+        "seats_hint": 0,
+        "inline_report_url": "",
+        "title": title,
+    }
+
+def detail_job_from_record(carid, rec):
+    href = rec.get("href") or ""
+    detail_url = absolutize(href) if href else (synth_detail_url(carid) or synth_legacy_detail_url(carid))
+    list_hint = list_hint_from_record(rec)
+    return {
+        "carid": carid,
+        "detail_url": detail_url,
+        "fetch_url": detail_fetch_url(carid, detail_url),
+        "list_hint": list_hint,
+        "fingerprint": list_fingerprint(list_hint["title"], list_hint["cmimi_eur"], detail_url),
+        "modified": rec.get("modified") or "",
+    }
+
+def page_list_xhr(browser, page_no):
+    """
+    Newest search response for `page_no` captured since the last go_to_page,
+    or None. Responses for other pages, count-only calls and prefetches are
+    skipped, so rows are never paired with another page's records.
+    """
+    xhr = take_xhr_json(browser, XHR_LIST_URL_RE, since=xhr_scope_since(browser, "list"),
+                        page=(int(page_no), list_page_size()))
+    return next((x for x in reversed(xhr) if get_list_records_from_state(x)), None)
+
+def page_detail_jobs(browser, page_no=1):
+    """
+    Detail jobs for the list page currently shown, keyed by the carids that
+    get_list_records_from_state / deep_collect_car_records_from_state find.
+    Falls back to DOM-collected detail links when the state has no carids.
+    """
+    list_state = list_state_projection(browser, 3)
+    xhr = page_list_xhr(browser, page_no)
+    if xhr:
+        list_state = {"xhr": xhr, "state": list_state}
+    record_by_cid = defaultdict(dict)
+    for r in get_list_records_from_state(list_state):
+        if r.get("carid"): record_by_cid[r["carid"]].update(r)
+    carids, by_carid = deep_collect_car_records_from_state(list_state)
+    for cid, r in by_carid.items():
+        record_by_cid[cid].update(r)
+    order = dedup([r for r in record_by_cid] + carids)
+    if not order:
+        order = dedup(carid_from_url(u) for u in collect_listing_urls_dom(browser, want_urls=list_page_size() * 2))
+    return [detail_job_from_record(cid, record_by_cid.get(cid, {})) for cid in order]
+
+def detail_worker(wid, jobs, emit):
+    """
+    One worker = one independent Chrome (started lazily, only if the HTTP
+    fast path misses). Pulls jobs until it sees the None sentinel.
+    """
+    from contextlib import ExitStack
+    stack = ExitStack()
+    browser = None
+    try:
+        while True:
+            job = jobs.get()
+            if job is None:
+                jobs.task_done()
+                return
+            try:
+                raw = scrape_detail_raw_http(job["fetch_url"]) if DETAIL_FETCH == "http" else None
+                if raw is None:
+                    if browser is None:
+                        base = os.getenv("CHROME_USER_DATA_DIR") or tempfile.mkdtemp(prefix="encar-chrome-")
+                        browser = stack.enter_context(build_browser(os.path.join(base, f"worker-{wid}")))
+                    mark_xhr_scope(browser, "detail", XHR_DETAIL_URL_RE)
+                    if not visit_safely(browser, job["detail_url"]):
+                        debug_dump(browser, f"worker{wid}_visit_fail")
+                        continue
+                    raw = scrape_detail_raw(browser)
+                alb = to_albanian_schema(raw, job["detail_url"], job["list_hint"])
+                emit(csv_row_from_albanian(alb), job)
+            except Exception as e:
+                print(f"[worker {wid}] {job.get('detail_url')}: {e}")
+            finally:
+                jobs.task_done()
+    finally:
+        stack.close()
+
+def shard_page_ranges(first_page, total_pages, shards):
+    """Split pages first_page..total_pages into at most `shards` contiguous ranges."""
+    pages = list(range(first_page, (total_pages or first_page) + 1))
+    shards = max(1, min(shards, len(pages)))
+    size, extra = divmod(len(pages), shards)
+    out, i = [], 0
+    for k in range(shards):
+        n = size + (1 if k < extra else 0)
+        out.append(pages[i:i + n])
+        i += n
+    return out
+
+def open_list_shard(browser, list_url):
+    """Load the search results (same filters/hash as the main browser) in a shard browser."""
+    if not visit_safely(browser, list_url):
+        return False
+    ensure_english(browser, 5)
+    if not wait_for_list(browser, timeout=25):
+        return force_load_list_rows(browser) > 0
+    return True
+
+def run_worker_pool(browser, sink, workers, ck=None, list_shards=1, list_urls=None):
+    """
+    The list browser stays on the search results and fills a shared queue;
+    `workers` detail threads (each with its own Chrome) drain it into `sink`.
+    With `list_shards` > 1 and a known page count, the page range is split and
+    each extra shard walks its slice in its own Chrome, jumping straight to its
+    first page through go_to_page's hash rewrite.
+    `list_urls` (search-filter shards, see plan_filter_shards) are walked
+    concurrently instead, one browser each, all merged by carid.
+    `ck` resumes a previous run. Returns the number of rows emitted.
+    """
+    import queue
+    jobs = queue.Queue(maxsize=workers * 4)
+    lock = threading.Lock()
+    done_carids = set((ck or {}).get("done") or [])
+    done = [int((ck or {}).get("total_done") or 0)]
+    pending = {}   # carid -> list page it was queued from
+
+    def emit(row_out, job):
+        with lock:
+            done[0] += 1
+            done_carids.add(job["carid"])
+            pending.pop(job["carid"], None)
+            # resume from the oldest page that still has jobs in flight
+            sink.put(row_out, job["carid"], job["fingerprint"], min(pending.values(), default=job["page"]), 0)
+            print(f"✅ {done[0]}/{MAX_LISTINGS} (carid {job['carid']})")
+
+    threads = [threading.Thread(target=detail_worker, args=(i, jobs, emit), name=f"detail-{i}", daemon=True)
+               for i in range(workers)]
+    for t in threads: t.start()
+
+    queued = set(done_carids)
+    skipped = [len(done_carids) - done[0]]
+    list_lock = threading.Lock()   # queued/skipped are shared by the list shards
+    wm = {"mark": None, "high": None, "stop": None}
+
+    def walk_pages(br, pages, tag, first=None):
+        """Queue detail jobs for `pages` (None = open-ended from `first` until the list runs dry)."""
+        current_page = pages[0] if pages else (first or int((ck or {}).get("page") or 1))
+        total_pages = None
+        wm["stop"] = "end"
+        while True:
+            if pages is not None and current_page > pages[-1]:
+                break
+            with list_lock:
+                if len(queued) - skipped[0] >= MAX_LISTINGS:
+                    wm["stop"] = "cap"
+                    break
+            if current_page > 1:
+                if total_pages and current_page > total_pages:
+                    break
+                if not go_to_page(br, current_page):
+                    break
+            page_jobs = page_detail_jobs(br, current_page)
+            if pages is None and wm["mark"] is not None:
+                wm["high"] = max(page_marks(page_jobs) + ([wm["high"]] if wm["high"] else []), default=None)
+                if page_below_watermark(page_jobs, wm["mark"]):
+                    print(f"[watermark] page {current_page}: nothing newer than {wm['mark'][0]}; stopping list crawl")
+                    wm["stop"] = "mark"
+                    break
+            with list_lock:
+                page_jobs = [j for j in page_jobs if j["carid"] and j["carid"] not in queued]
+                if not page_jobs:
+                    print(f"[pool{tag}] page {current_page}: no new carids; stopping list crawl")
+                    break
+                fresh = [j for j in page_jobs if not seen_unchanged(j["carid"], j["fingerprint"])]
+                queued.update(j["carid"] for j in page_jobs if j not in fresh)
+                skipped[0] += len(page_jobs) - len(fresh)
+                fresh = fresh[:max(0, MAX_LISTINGS - (len(queued) - skipped[0]))]
+                queued.update(j["carid"] for j in fresh)
+                n_queued, n_skipped = len(queued) - skipped[0], skipped[0]
+            for job in fresh:
+                job["page"] = current_page
+                with lock:
+                    pending[job["carid"]] = current_page
+                jobs.put(job)
+            print(f"[pool{tag}] page {current_page}: queued {n_queued} detail jobs, {n_skipped} unchanged skipped")
+            report_network_stats(br, f"list p{current_page}")
+            current_page += 1
+            _, tp = get_paging_info(br)
+            total_pages = tp or total_pages
+
+    def shard_worker(sid, list_url, pages):
+        base = os.getenv("CHROME_USER_DATA_DIR") or tempfile.mkdtemp(prefix="encar-chrome-")
+        try:
+            with build_browser(os.path.join(base, f"list-{sid}")) as br:
+                if open_list_shard(br, list_url):
+                    walk_pages(br, pages, f" s{sid}", first=1)
+                else:
+                    print(f"[pool s{sid}] list did not load; shard skipped")
+        except Exception as e:
+            print(f"[pool s{sid}] {e}")
+
+    first_page = int((ck or {}).get("page") or 1)
+    _, total_pages = get_paging_info(browser)
+    ranges = shard_page_ranges(first_page, total_pages, list_shards) if list_shards > 1 and total_pages else None
+    try:
+        if list_urls:
+            # Filter shards are disjoint queries; page numbers restart at 1 in each
+            print(f"[pool] {len(list_urls)} filter shards")
+            shard_threads = [threading.Thread(target=shard_worker, args=(i, u, None),
+                                              name=f"list-{i}", daemon=True)
+                             for i, u in enumerate(list_urls[1:], 1)]
+            for t in shard_threads: t.start()
+            if open_list_shard(browser, list_urls[0]):
+                walk_pages(browser, None, " s0", first=1)
+            for t in shard_threads: t.join()
+        elif not ranges or len(ranges) == 1:
+            if list_shards > 1:
+                print("[pool] page count unknown; list pages walked sequentially")
+            # Only a single ModifiedDate-ordered walk can stop early at the watermark
+            wm["mark"] = (watermark_load() or ("", "")) if WATERMARK else None
+            walk_pages(browser, None, "")
+        else:
+            print(f"[pool] {total_pages} pages in {len(ranges)} shards: "
+                  + ", ".join(f"{r[0]}-{r[-1]}" for r in ranges))
+            list_url = safe_current_url(browser)
+            shard_threads = [threading.Thread(target=shard_worker, args=(i, list_url, r),
+                                              name=f"list-{i}", daemon=True)
+                             for i, r in enumerate(ranges[1:], 1)]
+            for t in shard_threads: t.start()
+            walk_pages(browser, ranges[0], " s0")
+            for t in shard_threads: t.join()
+    finally:
+        for _ in threads: jobs.put(None)
+        for t in threads: t.join()
+    # A capped walk never reached the old mark: keep it so the next run fills the gap
+    if wm["high"] and wm["stop"] in ("mark", "end"):
+        watermark_save(wm["high"])
+    return done[0]
+
+def bench_state(path, repeat=20):
+    """
+    Time the per-lookup walks against one StateIndex on saved states: a .json
+    file, a saved detail .html (its hydration state), or a directory of them.
+    Also checks that both give the same answers.
+    """
+    files = [path] if os.path.isfile(path) else sorted(
+        os.path.join(path, n) for n in os.listdir(path) if n.endswith((".json", ".html", ".htm")))
+    def lookups(st):
+        return (state_detail_fields(st, index=False) if not isinstance(st, StateIndex) else state_detail_fields(st),
+                deep_collect_carpicture_paths(st), deep_collect_report_links_from_state(st),
+                _extract_carid_from_state_or_url(st, ""), state_option_names(st))
+    for fp in files:
+        with open(fp, "r", encoding="utf-8") as fh:
+            text = fh.read()
+        st = fast_json_loads(text) if fp.endswith(".json") else extract_state_from_html(text)
+        if not st:
+            print(f"[bench] {fp}: no state")
+            continue
+        t0 = time.perf_counter()
+        for _ in range(repeat): walked = lookups(st)
+        t1 = time.perf_counter()
+        for _ in range(repeat): indexed = lookups(StateIndex(st))
+        t2 = time.perf_counter()
+        walk_ms, idx_ms = (t1 - t0) * 1000 / repeat, (t2 - t1) * 1000 / repeat
+        print(f"[bench] {os.path.basename(fp)}: {len(text)/1024:.0f} KB, walks {walk_ms:.2f} ms, "
+              f"index {idx_ms:.2f} ms ({walk_ms / max(idx_ms, 1e-9):.1f}x), "
+              f"{'same results' if walked == indexed else 'RESULTS DIFFER'}")
+
+def parse_args(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Encar list/detail scraper")
+    ap.add_argument("--workers", type=int, default=int(os.getenv("WORKERS", "1")),
+                    help="parallel detail workers, each with its own browser (default: 1 = sequential)")
+    ap.add_argument("--resume", action="store_true",
+                    default=os.getenv("RESUME", "").strip().lower() in ("1", "true", "yes"),
+                    help="continue from the last checkpoint (page/row, CSV offset) instead of page 1")
+    ap.add_argument("--list-shards", type=int, default=int(os.getenv("LIST_SHARDS", "1")),
+                    help="split the result pages into N ranges, each walked by its own browser "
+                         "(uses the worker pool; default: 1 = pages one after another)")
+    ap.add_argument("--year-bands", default=YEAR_BANDS,
+                    help='split the search into disjoint model-year queries walked concurrently, '
+                         'e.g. "2015-2017,2018-2020,2021-" or "auto" (uses the worker pool)')
+    ap.add_argument("--bench-state", metavar="PATH",
+                    help="benchmark state lookups (per-field walks vs StateIndex) on saved "
+                         ".json/.html state fixtures, then exit without scraping")
+    return ap.parse_args(argv)
+
+def main(argv=None):
     import time, os, csv, json, re, random
+    args = parse_args(argv)
+    if args.bench_state:
+        bench_state(args.bench_state)
+        return
     with build_browser() as browser:
         # Try multiple shells until one mounts rows/state/links
         loaded = False
@@ -2532,8 +4896,6 @@ def main():
                 browser.visit(url)
             except Exception:
                 continue
-            # light human-ish pacing
-            time.sleep(random.uniform(1.2, 2.0))
             wait_ready(browser, 12)
             ensure_english(browser, 5)
             try:
@@ -2550,31 +4912,40 @@ def main():
 
         # Make sure the first page actually has rows, then force-load
         if not wait_for_list(browser, timeout=25):
-            force_load_list_rows(browser, want=PER_PAGE)
+            force_load_list_rows(browser)
 
-        cnt = force_load_list_rows(browser, want=PER_PAGE)
+        cnt = force_load_list_rows(browser)
         print(f"[list] rows loaded: {cnt}")
 
         os.makedirs(CSV_DIR, exist_ok=True)
         csv_path = os.path.join(CSV_DIR, CSV_NAME)
 
-        fields = [
-            "prodhuesi","modeli","varianti","viti",
-            "cmimi_eur","kilometrazhi_km","karburanti","ngjyra",
-            "transmisioni","uleset","vin","engine_cc","images","listing_url",
-            "opsionet","raporti_url"
-        ]
-
-        with open(csv_path, "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
+        f, ck = open_run_csv(csv_path, resume=args.resume)
+        # A resumed run must page with the size its checkpoint was written under
+        if ck and ck.get("limit"):
+            if set_list_page_size(ck["limit"]) != PER_PAGE:
+                go_to_page(browser, 1)
+        elif cnt:
+            probe_page_size(browser)
+        with f, RowSink(f, ck) as sink:
+            filter_urls = plan_filter_shards(spec=args.year_bands)
+            if args.workers > 1 or args.list_shards > 1 or filter_urls:
+                total_done = run_worker_pool(browser, sink, args.workers, ck=ck,
+                                             list_shards=args.list_shards, list_urls=filter_urls)
+                print(f"🎯 Finished ({total_done} rows, {args.workers} workers). Saved to {csv_path}")
+                write_debug_html(browser)
+                return
 
-            total_done = 0
-            current_page = 1
+            ck = ck or {}
+            done_carids = set(ck.get("done") or [])
+            total_done = int(ck.get("total_done") or 0)
+            skipped = 0
+            current_page = int(ck.get("page") or 1)
+            resume_row = int(ck.get("row_index") or 0)
             _, total_pages = get_paging_info(browser)
 
             # Up-front state pull (helps fallback pairing)
-            list_state = get_full_state(browser) if wait_for_state(browser, 4) else {}
+            list_state = list_state_projection(browser, 4)
             state_records = get_list_records_from_state(list_state)
 
             # Quick row probe
@@ -2614,8 +4985,7 @@ def main():
                 i = 0
                 while i < len(urls) and total_done < MAX_LISTINGS:
                     detail_url = urls[i]
-                    m = re.search(r'/detail/(\d{6,})|[?&]carid=(\d{6,})', detail_url)
-                    carid = (m.group(1) or m.group(2)) if m else ""
+                    carid = carid_from_url(detail_url)
 
                     # Pair list info by carid
                     rec = record_by_cid.get(carid, {})
@@ -2626,22 +4996,29 @@ def main():
                     brand, model, variant = parse_title_brand_model_variant(title)
                     _krw, eur_list = parse_list_price_eur(priceText, priceNum, "")
 
-                    # Open detail directly (visit in same tab here)
-                    try:
-                        browser.visit(detail_url)
-                    except Exception:
-                        # if blocked once, small pause then retry a second time
-                        time.sleep(random.uniform(0.8, 1.6))
+                    fingerprint = list_fingerprint(title, eur_list, detail_url)
+                    if carid in done_carids or seen_unchanged(carid, fingerprint):
+                        skipped += 1
+                        i += 1
+                        continue
+
+                    raw = scrape_detail_raw_http(detail_fetch_url(carid, detail_url)) if DETAIL_FETCH == "http" else None
+                    if raw is None:
+                        # Open detail directly (visit in same tab here)
+                        mark_xhr_scope(browser, "detail", XHR_DETAIL_URL_RE)
                         try:
                             browser.visit(detail_url)
                         except Exception:
-                            debug_dump(browser, "detail_visit_error")
-                            i += 1
-                            continue
+                            # if blocked once, small pause then retry a second time
+                            time.sleep(random.uniform(0.8, 1.6))
+                            try:
+                                browser.visit(detail_url)
+                            except Exception:
+                                debug_dump(browser, "detail_visit_error")
+                                i += 1
+                                continue
 
-                    time.sleep(random.uniform(0.8, 1.5))
-                    ensure_english(browser, 4)
-                    raw = scrape_detail_raw(browser)
+                        raw = scrape_detail_raw(browser)
 
                     list_hint = {
                         "prodhuesi": brand,
@@ -2656,53 +5033,27 @@ def main():
                     }
 
                     alb = to_albanian_schema(raw, detail_url, list_hint)
-                    row_out = {
-                        "prodhuesi": alb["prodhuesi"],
-                        "modeli": alb["modeli"],
-                        "varianti": alb["varianti"],
-                        "viti": alb["viti"],
-                        "cmimi_eur": alb["cmimi_eur"],
-                        "kilometrazhi_km": alb["kilometrazhi_km"],
-                        "karburanti": alb["karburanti"],
-                        "ngjyra": alb["ngjyra"],
-                        "transmisioni": alb["transmisioni"],
-                        "uleset": "" if alb["uleset"] is None else str(alb["uleset"]),
-                        "vin": alb["vin"],
-                        "engine_cc": alb["engine_cc"],
-                        "images": ";".join(alb.get("images", [])),
-                        "listing_url": alb["listing_url"],
-                        "opsionet": alb["opsionet"],
-                        "raporti_url": alb["raporti_url"],
-                    }
-                    row_out = fill_blanks_in_row(row_out)
-
-                    if WRITE_DB:
-                        missing = [v for v in ("DB_HOST","DB_PORT","DB_USERNAME","DB_PASSWORD","DB_DATABASE") if not os.getenv(v)]
-                        if missing:
-                            print(f"[skip-db] missing {', '.join(missing)}; skipping DB upsert")
-                        else:
-                            upsert_vehicle(row_out)
+                    row_out = csv_row_from_albanian(alb)
 
-                    writer.writerow(row_out)
                     total_done += 1
                     i += 1
+                    if carid: done_carids.add(carid)
+                    sink.put(row_out, carid, fingerprint, 1, i)
                     print(f"✅ {total_done}/{MAX_LISTINGS} (fallback-by-carid)")
 
                     # tiny jitter between cars
                     time.sleep(random.uniform(0.25, 0.55))
 
-                print(f"🎯 Finished. Saved to {csv_path}")
-                try:
-                    debug_dir = os.path.join(APP_ROOT, "scripts")
-                    os.makedirs(debug_dir, exist_ok=True)
-                    with open(os.path.join(debug_dir, "debug.html"), "w", encoding="utf-8") as df:
-                        df.write(browser.html or "")
-                except Exception as _e:
-                    print(f"[debug-skip] could not write debug.html: {_e}")
+                print(f"🎯 Finished ({skipped} unchanged skipped). Saved to {csv_path}")
+                write_debug_html(browser)
                 return
             # ------- /FALLBACK FLOW -------
 
             # ---------------------- NORMAL ROW-BASED BRANCH --------------------
+            mark = (watermark_load() or ("", "")) if WATERMARK else None
+            high_mark, stop_reason = None, "end"
+            tab_pool = False if DETAIL_TABS > 0 else None   # opened on first use
+            http_missed = False   # last HTTP detail fetch needed the browser
             while total_done < MAX_LISTINGS:
                 if current_page > 1:
                     if not go_to_page(browser, current_page):
@@ -2710,11 +5061,11 @@ def main():
                             break
                         if not go_to_page(browser, current_page):
                             break
-                    cnt = force_load_list_rows(browser, want=PER_PAGE)
+                    cnt = force_load_list_rows(browser)
                     print(f"[list] page {current_page} rows loaded: {cnt}")
 
-                time.sleep(random.uniform(0.5, 1.2))
                 ensure_english(browser, 3)
+                report_network_stats(browser, f"list p{current_page}")
 
                 # Quick bot-wall check
                 try:
@@ -2726,35 +5077,56 @@ def main():
                 except Exception:
                     pass
 
-                list_state = get_full_state(browser) if wait_for_state(browser, 3) else {}
-                state_records = get_list_records_from_state(list_state)
-
-                rows = find_list_rows(browser)
-                rows_count = len(rows)
-                if rows_count < PER_PAGE:
-                    extra = force_load_list_rows(browser, want=PER_PAGE)
-                    rows = find_list_rows(browser)
-                    rows_count = len(rows)
-                    print(f"[list] visible rows now: {rows_count} (force_load returned {extra})")
-
-                row_index = 0
-                while row_index < rows_count and total_done < MAX_LISTINGS:
-                    rows = find_list_rows(browser)
-                    if not rows or row_index >= len(rows):
+                list_state = list_state_projection(browser, 3)
+                # The app's own search response, when captured, beats the rendered state
+                xhr = page_list_xhr(browser, current_page)
+                state_records = get_list_records_from_state(xhr or list_state)
+                if mark is not None:
+                    high_mark = max(page_marks(state_records) + ([high_mark] if high_mark else []), default=None)
+                    if page_below_watermark(state_records, mark):
+                        print(f"[watermark] page {current_page}: nothing newer than {mark[0]} (carid {mark[1]}); stopping")
+                        stop_reason = "mark"
                         break
 
-                    row = rows[row_index]
+                page_rows = list_page_records(browser)
+                rows_count = len(page_rows)
+                if rows_count < list_page_size():
+                    extra = force_load_list_rows(browser)
+                    page_rows = list_page_records(browser)
+                    rows_count = len(page_rows)
+                    print(f"[list] visible rows now: {rows_count} (force_load returned {extra})")
 
-                    rec = state_records[row_index] if row_index < len(state_records) else None
+                def row_record(idx):
+                    # State record for row idx (when it has a title) with the DOM row's html/carid
+                    dom_rec = page_rows[idx]
+                    rec = state_records[idx] if idx < len(state_records) else None
                     if rec and not rec.get("title"):
                         rec = None
                     if not rec:
-                        rec = list_row_dom_extract(row)
-                    else:
-                        try:
-                            rec["row_html"] = row.html
-                        except Exception:
-                            rec["row_html"] = ""
+                        return dict(dom_rec)
+                    rec["row_html"] = dom_rec["row_html"]
+                    rec["carid"] = rec.get("carid") or dom_rec["carid"]
+                    return rec
+
+                needs_scrape = {}
+
+                def row_needs_scrape(idx):
+                    # Memoised per page: the prefetch look-ahead asks again from every scraped row
+                    if idx in needs_scrape:
+                        return needs_scrape[idx]
+                    rec = row_record(idx)
+                    href = rec.get("href") or ""
+                    cid = rec.get("carid") or carid_from_url(href)
+                    _krw, eur = parse_list_price_eur((rec.get("priceText") or "").strip(), rec.get("priceNum", None), rec.get("row_html") or "")
+                    fp = list_fingerprint((rec.get("title") or "").strip(), eur, absolutize(href) if href else synth_detail_url(cid))
+                    needs_scrape[idx] = not ((cid and cid in done_carids) or seen_unchanged(cid, fp))
+                    return needs_scrape[idx]
+
+                row_index, resume_row = resume_row, 0
+                inline_by_idx = None
+                while row_index < rows_count and total_done < MAX_LISTINGS:
+                    dom_rec = page_rows[row_index]
+                    rec = row_record(row_index)
 
                     title     = (rec.get("title") or "").strip()
                     priceText = (rec.get("priceText") or "").strip()
@@ -2765,75 +5137,116 @@ def main():
                     brand, model, variant = parse_title_brand_model_variant(title)
                     krw_list, eur_list = parse_list_price_eur(priceText, priceNum, row_html)
 
-                    panel = _get_inline_panel_html(browser, row_index)
-                    inline_vals = parse_inline_detail_values(panel)
+                    # Unchanged since the last run: no panel, report click or detail visit
+                    carid = rec.get("carid") or carid_from_url(href_raw)
+                    fingerprint = list_fingerprint(title, eur_list, absolutize(href_raw) if href_raw else synth_detail_url(carid))
+                    if (carid and carid in done_carids) or seen_unchanged(carid, fingerprint):
+                        skipped += 1
+                        row_index += 1
+                        continue
+
+                    # All remaining rows' panels in one pass, on the first row that needs them
+                    if inline_by_idx is None:
+                        inline_by_idx = harvest_inline_panels(browser, range(row_index, rows_count))
+                        if REPORT_CHECK:
+                            validate_report_urls(r.get("carid") for r in page_rows[row_index:])
+                    if inline_by_idx is not None:
+                        inline_vals = inline_by_idx.get(row_index) or {}
+                    else:
+                        inline_vals = parse_inline_detail_values(_get_inline_panel_html(browser, row_index))
                     color_hint_raw = inline_vals.get("color_raw")
                     seats_hint     = inline_vals.get("seats") or 0
 
-                    inline_report_url = get_inline_report_url(browser, row_index)
-
-                    # Fallback: build report URL from list href (?carid=XXXX)
-                    if not inline_report_url and href_raw:
-                        m = re.search(r'[?&]carid=(\d+)', href_raw)
-                        if m:
-                            inline_report_url = _build_report_url_from_carid(m.group(1))
-
-                    listing_thumb = extract_listing_thumb(row)
+                    # Report link straight from the carid; panel/tab scraping only without one
+                    if carid:
+                        inline_report_url = resolve_report_url(carid)
+                    elif inline_by_idx is not None:
+                        inline_report_url = inline_vals.get("report_url") or ""
+                    else:
+                        inline_report_url = get_inline_report_url(browser, row_index)
 
-                    # Try to open detail (prefer new tab, but we can recover to same-tab visit)
-                    prev_tabs = len(browser.windows)
-                    detail_url = click_detail_and_get_url(browser, row, retries=3, force_new_tab=True)
+                    listing_thumb = dom_rec["thumb"]
 
-                    opened_in_new_tab = switch_to_new_tab(browser, prev_tabs, 8)
+                    # Browser-free fast path first; Chrome only when the HTML lacks the state
+                    detail_url = absolutize(href_raw) if href_raw else synth_detail_url(carid)
                     raw = None
-
-                    if opened_in_new_tab:
-                        try:
-                            time.sleep(random.uniform(0.7, 1.3))
-                            ensure_english(browser, 4)
-                            raw = scrape_detail_raw(browser)
-                        finally:
-                            # Always close the tab to return to list
+                    if DETAIL_FETCH == "http" and detail_url:
+                        fetch_url = detail_fetch_url(carid, detail_url)
+                        hit, raw = take_prefetched_http(fetch_url)
+                        if not hit:
+                            raw = scrape_detail_raw_http(fetch_url)
+                        http_missed = raw is None
+
+                    # Known URL: re-navigate a pooled tab, no click/new-tab/close round
+                    if raw is None and detail_url and tab_pool is not None:
+                        if tab_pool is False:
+                            tab_pool = DetailTabPool(browser)
+                        raw = tab_pool.scrape(detail_url)
+
+                    # The next row that will really be scraped (unchanged rows are skipped
+                    # without a detail fetch) starts loading while this one is written
+                    if PREFETCH and total_done + 1 < MAX_LISTINGS:
+                        nxt = next((row_record(j) for j in range(row_index + 1, rows_count) if row_needs_scrape(j)), None)
+                        nxt_cid = (nxt.get("carid") or carid_from_url(nxt.get("href") or "")) if nxt else ""
+                        nxt_url = (absolutize(nxt["href"]) if nxt.get("href") else synth_detail_url(nxt_cid)) if nxt else ""
+                        if nxt_url:
+                            if DETAIL_FETCH == "http":
+                                prefetch_detail_http(detail_fetch_url(nxt_cid, nxt_url))
+                            if tab_pool and (DETAIL_FETCH != "http" or http_missed):
+                                tab_pool.prefetch(nxt_url)
+
+                    if raw is None:
+                        # Try to open detail (prefer new tab, but we can recover to same-tab visit)
+                        mark_xhr_scope(browser, "detail", XHR_DETAIL_URL_RE)
+                        prev_tabs = len(browser.windows)
+                        rows = find_list_rows(browser)
+                        row = live_row_by_index(rows, dom_rec["idx"])
+                        detail_url = click_detail_and_get_url(browser, row, retries=3, force_new_tab=True) if row else ""
+
+                        opened_in_new_tab = switch_to_new_tab(browser, prev_tabs, 8)
+
+                        if opened_in_new_tab:
                             try:
-                                browser.windows.current.close()
-                            except Exception:
-                                pass
-                            try:
-                                browser.windows[0].is_current = True
-                            except Exception:
-                                pass
-                            time.sleep(random.uniform(0.2, 0.5))
-                    else:
-                        # If no new tab, drive there in the same tab (or use href_raw)
-                        if not detail_url and href_raw:
-                            detail_url = absolutize(href_raw)
-                        if detail_url:
-                            try:
-                                browser.visit(detail_url)
-                                time.sleep(random.uniform(0.7, 1.3))
-                                ensure_english(browser, 4)
                                 raw = scrape_detail_raw(browser)
-                            except Exception:
-                                debug_dump(browser, "detail_visit_fallback_err")
                             finally:
-                                # Best-effort return to list
+                                # Always close the tab to return to list
+                                try:
+                                    browser.windows.current.close()
+                                except Exception:
+                                    pass
                                 try:
-                                    browser.back()
-                                    wait_for_list(browser, timeout=12)
+                                    browser.windows[0].is_current = True
                                 except Exception:
                                     pass
                         else:
-                            # Could not navigate to detail; synthesize a minimal raw
-                            raw = {
-                                "manufacturer": "", "model": "", "grade": "",
-                                "form_year": "", "year_month": "",
-                                "ad_price": "", "price_text": priceText,
-                                "mileage": "", "fuel": "", "color": "",
-                                "transmission": "", "seats": "",
-                                "vin": "", "engine_cc": "",
-                                "images": [], "body_type": "",
-                                "features": [], "report_links": [], "carid": ""
-                            }
+                            # If no new tab, drive there in the same tab (or use href_raw)
+                            if not detail_url and href_raw:
+                                detail_url = absolutize(href_raw)
+                            if detail_url:
+                                try:
+                                    browser.visit(detail_url)
+                                    raw = scrape_detail_raw(browser)
+                                except Exception:
+                                    debug_dump(browser, "detail_visit_fallback_err")
+                                finally:
+                                    # Best-effort return to list
+                                    try:
+                                        browser.back()
+                                        wait_for_list(browser, timeout=12)
+                                    except Exception:
+                                        pass
+                            else:
+                                # Could not navigate to detail; synthesize a minimal raw
+                                raw = {
+                                    "manufacturer": "", "model": "", "grade": "",
+                                    "form_year": "", "year_month": "",
+                                    "ad_price": "", "price_text": priceText,
+                                    "mileage": "", "fuel": "", "color": "",
+                                    "transmission": "", "seats": "",
+                                    "vin": "", "engine_cc": "",
+                                    "images": [], "body_type": "",
+                                    "features": [], "report_links": [], "carid": ""
+                                }
 
                     imgs = raw.get("images", []) if raw else []
                     if listing_thumb:
@@ -2856,37 +5269,12 @@ def main():
 
                     alb = to_albanian_schema(raw or {}, detail_url, list_hint)
 
-                    row_out = {
-                        "prodhuesi": alb["prodhuesi"],
-                        "modeli": alb["modeli"],
-                        "varianti": alb["varianti"],
-                        "viti": alb["viti"],
-                        "cmimi_eur": alb["cmimi_eur"],
-                        "kilometrazhi_km": alb["kilometrazhi_km"],
-                        "karburanti": alb["karburanti"],
-                        "ngjyra": alb["ngjyra"],
-                        "transmisioni": alb["transmisioni"],
-                        "uleset": "" if alb["uleset"] is None else str(alb["uleset"]),
-                        "vin": alb["vin"],
-                        "engine_cc": alb["engine_cc"],
-                        "images": ";".join(alb.get("images", [])),
-                        "listing_url": alb["listing_url"],
-                        "opsionet": alb["opsionet"],
-                        "raporti_url": alb["raporti_url"],
-                    }
-                    row_out = fill_blanks_in_row(row_out)
-
-                    if WRITE_DB:
-                        missing = [v for v in ("DB_HOST","DB_PORT","DB_USERNAME","DB_PASSWORD","DB_DATABASE") if not os.getenv(v)]
-                        if missing:
-                            print(f"[skip-db] missing {', '.join(missing)}; skipping DB upsert")
-                        else:
-                            upsert_vehicle(row_out)
-
-                    writer.writerow(row_out)
+                    row_out = csv_row_from_albanian(alb)
 
                     total_done += 1
                     row_index += 1
+                    if carid: done_carids.add(carid)
+                    sink.put(row_out, carid or (raw or {}).get("carid"), fingerprint, current_page, row_index)
                     print(f"✅ {total_done}/{MAX_LISTINGS} (page {current_page}, row {row_index})")
 
                     # small human-like pause
@@ -2895,16 +5283,17 @@ def main():
                 current_page += 1
                 _, tp = get_paging_info(browser)
                 total_pages = tp or total_pages
+            else:
+                stop_reason = "cap"
+            if tab_pool:
+                tab_pool.close()
 
-        print(f"🎯 Finished. Saved to {csv_path}")
+        # Rows are on disk now; a capped run never reached the old mark, so keep it
+        if high_mark and stop_reason != "cap":
+            watermark_save(high_mark)
+        print(f"🎯 Finished ({skipped} unchanged skipped). Saved to {csv_path}")
 
-        try:
-            debug_dir = os.path.join(APP_ROOT, "scripts")
-            os.makedirs(debug_dir, exist_ok=True)
-            with open(os.path.join(debug_dir, "debug.html"), "w", encoding="utf-8") as fdbg:
-                fdbg.write(browser.html or "")
-        except Exception as _e:
-            print(f"[debug-skip] could not write debug.html: {_e}")
+        write_debug_html(browser)
 
 
 if __name__ == "__main__":